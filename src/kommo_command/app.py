@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import json
 import logging
+import queue
 import signal
 import sys
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from dotenv import find_dotenv, load_dotenv
@@ -88,6 +89,10 @@ class GracefulKiller:
         signal.signal(signal.SIGTERM, self.exit_gracefully)
 
     def exit_gracefully(self, *_: object) -> None:
+        # Only set the Event here: this runs as a signal handler on the main
+        # thread, and anything touching a non-reentrant lock (like
+        # queue.Queue.put) can deadlock against the interrupted frame. The
+        # main loop polls kill_now on a short get() timeout instead.
         self.kill_now.set()
 
 
@@ -233,78 +238,98 @@ def run(settings: Settings | None = None) -> None:
         logger.error(f"Failed to initialize Firebase services: {e}")
         sys.exit(1)
 
+    event_queue: queue.Queue = queue.Queue()
     killer = GracefulKiller()
 
     try:
-        # Signal the services to stop when we receive a shutdown signal
+        # Signal the services to stop when we receive a shutdown signal.
+        # Each close() can block on a network round-trip (HTTP connection
+        # teardown, gRPC channel shutdown), so close them concurrently and
+        # guard each one so a single failure doesn't hold up the rest.
+        def _close_service(service) -> None:
+            try:
+                service.close()
+            except Exception as e:
+                logger.error(f"Error closing {service.__class__.__name__}: {e}")
+
         def signal_services_stop():
-            if kommo_service:
-                kommo_service.close()
-            if love_bali_service:
-                love_bali_service.close()
-            if realtime_listener:
-                realtime_listener.close()
-            if firestore_service:
-                firestore_service.close()
+            services = [
+                s
+                for s in (kommo_service, love_bali_service, realtime_listener, firestore_service)
+                if s is not None
+            ]
+            if services:
+                with ThreadPoolExecutor(max_workers=len(services)) as pool:
+                    list(pool.map(_close_service, services))
             if handler_manager:
                 handler_manager.clear_handlers()
         
-        # Start listening for events in a separate thread so we can handle signals
-        event_queue = []
-        event_lock = threading.Lock()
+        # Start listening for events in a separate thread so we can handle signals.
+        # queue.Queue is already thread-safe, so no extra lock or polling sleep is needed:
+        # the main loop blocks on get() and wakes as soon as an event arrives.
         listener_error: list[Exception | None] = [None]  # Use list to allow modification from nested function
-        
+
         def listener_thread():
             try:
                 for event in realtime_listener.events():
-                    with event_lock:
-                        event_queue.append(event)
+                    event_queue.put(event)
                     if killer.kill_now.is_set():
                         break
             except Exception as e:
                 listener_error[0] = e
                 logger.exception("Fatal error in listener thread")
-        
+
         # Start the listener thread
         thread = threading.Thread(target=listener_thread, daemon=True)
         thread.start()
-        
+
         # Main loop that can respond to signals
         while not killer.kill_now.is_set() and thread.is_alive():
             # Check for any listener errors
             if listener_error[0]:
                 raise listener_error[0]
-            
-            # Process any queued events
-            events_to_process = []
-            with event_lock:
-                events_to_process = event_queue[:]
-                event_queue.clear()
-            
-            for event in events_to_process:
-                # Log the raw event for debugging
-                logger.info(
-                    "Firebase Event Received",
-                    extra={
-                        "event": event.event,
-                        "path": event.path,
-                        "data": event.data,
-                    },
-                )
-                
-                # Process the event through the handler system
+
+            # Block until an event arrives; the timeout bounds how long a
+            # shutdown signal waits before the kill_now check re-runs.
+            try:
+                event = event_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            # Drain everything already queued so bursts of SSE patch events
+            # are dispatched in a single batch.
+            events = [event]
+            while True:
                 try:
-                    handler_manager.process_event(event.path, event.data)
-                except Exception as e:
-                    logger.error(f"Error processing event through handlers: {e}", exc_info=True)
-                
-                # Keep the existing language selection logic as backup/additional processing
+                    events.append(event_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            # Log raw events only when debugging: building the extra dict per
+            # event is pure overhead under burst load, and handlers emit their
+            # own structured logs
+            if logger.isEnabledFor(logging.DEBUG):
+                for event in events:
+                    logger.debug(
+                        "Firebase Event Received",
+                        extra={
+                            "event": event.event,
+                            "path": event.path,
+                            "data": event.data,
+                        },
+                    )
+
+            # Process the batch through the handler system
+            try:
+                handler_manager.process_events([(e.path, e.data) for e in events])
+            except Exception as e:
+                logger.error(f"Error processing events through handlers: {e}", exc_info=True)
+
+            # Keep the existing language selection logic as backup/additional processing
+            for event in events:
                 if event.path.endswith('/language') and event.data:
                     logger.info(f"Language selection detected: {event.data}")
                     # Here you could update a session in Firestore based on the event
-            
-            # Small sleep to prevent busy waiting
-            time.sleep(0.1)
         
         if killer.kill_now.is_set():
             logger.info("Shutdown signal received. Stopping services...")
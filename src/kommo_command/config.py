@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class Settings(BaseModel):
+    # Frozen: settings are read-only after construction, which also makes the
+    # cached from_env() instance safe to share across the process
+    model_config = ConfigDict(frozen=True)
+
     firebase_database_url: str = Field(
         ...,
         description=(
@@ -70,23 +75,12 @@ class Settings(BaseModel):
 
     @classmethod
     def from_env(cls) -> Settings:
-        return cls(
-            firebase_database_url=os.getenv("FIREBASE_DATABASE_URL", "").rstrip("/"),
-            firebase_path=os.getenv("FIREBASE_PATH", "/"),
-            firebase_project_id=os.getenv("FIREBASE_PROJECT_ID", ""),
-            firestore_database_name=os.getenv("FIRESTORE_DATABASE_NAME", "kommo-webhook"),
-            google_service_account_file=os.getenv("GOOGLE_SERVICE_ACCOUNT_FILE"),
-            kommo_client_id=os.getenv("KOMMO_CLIENT_ID", ""),
-            kommo_client_secret=os.getenv("KOMMO_CLIENT_SECRET", ""),
-            kommo_subdomain=os.getenv("KOMMO_SUBDOMAIN", ""),
-            kommo_access_token=os.getenv("KOMMO_ACCESS_TOKEN", ""),
-            love_bali_base_url=os.getenv(
-                "LOVE_BALI_BASE_URL",
-                "https://lovebali.baliprov.go.id/api/v2/",
-            ),
-            love_bali_api_token=os.getenv("LOVE_BALI_API_TOKEN", ""),
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
-        )
+        """Return the process-wide Settings instance built from the environment.
+
+        The environment does not change after startup, so the instance (and
+        all its field validation) is computed once and cached.
+        """
+        return _settings_from_env()
 
     @field_validator("firebase_database_url")
     @classmethod
@@ -157,3 +151,29 @@ class Settings(BaseModel):
         if self.google_service_account_file:
             return "service_account"
         return "unauthenticated"
+
+
+# (model field, environment variable, default) consumed by _settings_from_env.
+# Normalization (stripping, trailing slashes, leading slashes) is handled by
+# the field validators, so the raw environment values pass straight through.
+_ENV_MAP: tuple[tuple[str, str, str | None], ...] = (
+    ("firebase_database_url", "FIREBASE_DATABASE_URL", ""),
+    ("firebase_path", "FIREBASE_PATH", "/"),
+    ("firebase_project_id", "FIREBASE_PROJECT_ID", ""),
+    ("firestore_database_name", "FIRESTORE_DATABASE_NAME", "kommo-webhook"),
+    ("google_service_account_file", "GOOGLE_SERVICE_ACCOUNT_FILE", None),
+    ("kommo_client_id", "KOMMO_CLIENT_ID", ""),
+    ("kommo_client_secret", "KOMMO_CLIENT_SECRET", ""),
+    ("kommo_subdomain", "KOMMO_SUBDOMAIN", ""),
+    ("kommo_access_token", "KOMMO_ACCESS_TOKEN", ""),
+    ("love_bali_base_url", "LOVE_BALI_BASE_URL", "https://lovebali.baliprov.go.id/api/v2/"),
+    ("love_bali_api_token", "LOVE_BALI_API_TOKEN", ""),
+    ("log_level", "LOG_LEVEL", "INFO"),
+)
+
+
+@lru_cache(maxsize=1)
+def _settings_from_env() -> Settings:
+    return Settings.model_validate(
+        {field: os.environ.get(env, default) for field, env, default in _ENV_MAP}
+    )
@@ -18,7 +18,45 @@ logger = logging.getLogger(__name__)
 
 class BaseHandler(ABC):
     """Base handler class for processing Firebase events."""
-    
+
+    # Optional regex (e.g. r"^/leads/\d+$") matched against the event path.
+    # Handlers that declare one are dispatched via a single combined regex
+    # compiled by HandlerManager instead of a per-handler can_handle call.
+    path_pattern: str | None = None
+
+    # Optional path prefixes (e.g. ("leads", "messages")) this handler is
+    # interested in. HandlerManager indexes handlers by the first path segment
+    # so only handlers registered for that segment are consulted per event;
+    # handlers that declare neither a pattern nor prefixes are checked for
+    # every event. can_handle still runs as the final filter.
+    path_prefixes: tuple[str, ...] = ()
+
+    # Set per subclass by __init_subclass__; shared by all instances of the
+    # handler class.
+    logger: logging.Logger
+
+    # Slot storage for the fixed per-handler attributes keeps them out of a
+    # per-instance __dict__ and makes their lookup cheaper on the hot path.
+    # Subclasses that don't declare __slots__ still get a __dict__ for any
+    # extra attributes they need.
+    __slots__ = (
+        "firestore_service",
+        "realtime_listener",
+        "kommo_service",
+        "love_bali_service",
+        "_rtdb_base",
+        "_rtdb_base_slash",
+    )
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Give each handler subclass its named logger once, at class creation.
+
+        Keeps self.logger working as before without hitting the logging
+        manager's lock on every handler instantiation.
+        """
+        super().__init_subclass__(**kwargs)
+        cls.logger = logging.getLogger(cls.__name__)
+
     def __init__(
         self,
         firestore_service: FirestoreService,
@@ -38,7 +76,10 @@ class BaseHandler(ABC):
         self.realtime_listener = realtime_listener
         self.kommo_service = kommo_service
         self.love_bali_service = love_bali_service
-        self.logger = logging.getLogger(self.__class__.__name__)
+        # The listener's base path never changes, so precompute the prefix
+        # used to build absolute Realtime Database paths per event
+        self._rtdb_base = realtime_listener.path.rstrip('/')
+        self._rtdb_base_slash = self._rtdb_base + '/'
     
     @abstractmethod
     def can_handle(self, event_path: str, event_data: Any) -> bool:
@@ -65,6 +106,24 @@ class BaseHandler(ABC):
         """
         pass
     
+    def can_handle_fast(self, event_path: str, event_data: Any) -> bool:
+        """
+        Cheap, non-raising variant of can_handle for the dispatch hot path.
+
+        Subclasses whose predicate is pure logic should override this with a
+        version that does no logging or I/O and cannot raise; HandlerManager
+        then calls it without an exception guard. The default delegates to
+        can_handle so unconverted handlers keep their existing behavior.
+
+        Args:
+            event_path: Firebase event path
+            event_data: Firebase event data
+
+        Returns:
+            True if this handler can process the event
+        """
+        return self.can_handle(event_path, event_data)
+
     def delete_realtime_data(self, path: str) -> bool:
         """
         Delete data from Firebase Realtime Database.
@@ -76,21 +135,15 @@ class BaseHandler(ABC):
             True if successful
         """
         try:
-            # Construct the absolute path by combining the listener's base path with the event path
-            # Event paths from Firebase Admin SDK are relative to the listening path
-            listener_base_path = self.realtime_listener.path.rstrip('/')
-            
-            # If the event path starts with '/', it's already relative to the base path
-            if path.startswith('/'):
-                # Remove leading slash and combine with base path
-                relative_path = path[1:]  # Remove leading '/'
-                absolute_path = f"{listener_base_path}/{relative_path}" if relative_path else listener_base_path
-            else:
-                # Path doesn't start with '/', combine directly
-                absolute_path = f"{listener_base_path}/{path}"
-            
-            self.logger.debug(f"Deleting from absolute path: {absolute_path} (event path: {path}, base: {listener_base_path})")
-            
+            # Construct the absolute path by combining the precomputed listener
+            # base prefix with the event path (event paths from the Firebase
+            # Admin SDK are relative to the listening path)
+            relative_path = path.lstrip('/')
+            absolute_path = self._rtdb_base_slash + relative_path if relative_path else self._rtdb_base
+
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Deleting from absolute path: {absolute_path} (event path: {path}, base: {self._rtdb_base})")
+
             success = self.realtime_listener.delete_data(absolute_path)
             if success:
                 self.logger.info(f"Successfully deleted data at path: {path}")
@@ -101,19 +154,34 @@ class BaseHandler(ABC):
             self.logger.error(f"Error deleting data at path {path}: {e}")
             return False
     
-    def save_to_firestore(self, collection: str, document_id: str, data: Dict[str, Any]) -> bool:
+    def save_to_firestore(
+        self,
+        collection: str,
+        document_id: str,
+        data: Dict[str, Any],
+        *,
+        buffered: bool = False,
+    ) -> bool:
         """
         Save data to Firestore.
-        
+
         Args:
             collection: Firestore collection name
             document_id: Document ID
             data: Data to save
-            
+            buffered: Queue the write into the service's shared WriteBatch
+                instead of committing immediately. Use only when the caller
+                does not depend on the write having landed (the batch is
+                flushed on size, on a short timer, and on shutdown).
+
         Returns:
             True if successful
         """
         try:
+            if buffered:
+                self.firestore_service.buffered_set(collection, document_id, data)
+                self.logger.info(f"Queued buffered write to {collection}/{document_id}")
+                return True
             collection_ref = self.firestore_service.get_collection_reference(collection)
             doc_ref = collection_ref.document(document_id)
             doc_ref.set(data)
@@ -3,21 +3,92 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, List
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Tuple
 
 from .base_handler import BaseHandler
 
+# (handler, class name, bound predicate, bound handle, predicate needs guard)
+# captured once at registration so the per-event loop skips repeated method
+# resolution through the class MRO and repeated __class__.__name__ lookups in
+# log statements. The predicate is can_handle_fast when the handler overrides
+# it (called without a try/except), otherwise the plain can_handle
+_DispatchEntry = Tuple[
+    BaseHandler, str, Callable[[str, Any], bool], Callable[[str, Any], None], bool
+]
+
 logger = logging.getLogger(__name__)
 
 
 class HandlerManager:
     """Manager class for coordinating Firebase event handlers."""
 
-    def __init__(self) -> None:
-        """Initialize the handler manager."""
+    # Fixed attribute set: slot storage keeps the per-event self.* reads in
+    # process_event off the instance __dict__
+    __slots__ = (
+        "handlers",
+        "default_handler",
+        "logger",
+        "_patterned_handlers",
+        "_dispatch_re",
+        "_dispatch_entries",
+        "_by_prefix",
+        "_wildcard",
+        "_default_entry",
+        "_capable_buf",
+        "_nondefault_buf",
+        "_handler_ids",
+        "_executor",
+    )
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        """
+        Initialize the handler manager.
+
+        Args:
+            max_workers: When set, handler execution is offloaded to a bounded
+                thread pool of this size so the dispatcher thread is not
+                parked on Firestore/Kommo I/O. Default (None) keeps dispatch
+                synchronous, preserving strict per-event ordering.
+        """
         self.handlers: List[BaseHandler] = []
         self.default_handler: BaseHandler | None = None
         self.logger = logging.getLogger(self.__class__.__name__)
+        # Handlers declaring a path_pattern are dispatched via one combined
+        # regex match instead of per-handler can_handle calls
+        self._patterned_handlers: List[BaseHandler] = []
+        self._dispatch_re: re.Pattern[str] | None = None
+        self._dispatch_entries: List[_DispatchEntry] = []
+        # Handlers indexed by the first segment of their declared
+        # path_prefixes; handlers declaring neither a pattern nor prefixes go
+        # to _wildcard and are consulted for every event
+        self._by_prefix: dict[str, List[_DispatchEntry]] = {}
+        self._wildcard: List[_DispatchEntry] = []
+        self._default_entry: _DispatchEntry | None = None
+        # Scratch buffers reused across process_event calls to avoid two list
+        # allocations per event; safe because dispatch is single-threaded
+        self._capable_buf: List[_DispatchEntry] = []
+        self._nondefault_buf: List[_DispatchEntry] = []
+        # Identity set mirroring self.handlers for O(1) membership pretests
+        self._handler_ids: set[int] = set()
+        self._executor = (
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="kommo-handler")
+            if max_workers
+            else None
+        )
+
+    def _recompile_dispatch(self) -> None:
+        """Rebuild the combined dispatch regex from registered path patterns."""
+        if not self._patterned_handlers:
+            self._dispatch_re = None
+            return
+        self._dispatch_re = re.compile(
+            "|".join(
+                f"(?P<h{i}>{handler.path_pattern})"
+                for i, handler in enumerate(self._patterned_handlers)
+            )
+        )
 
     def register_handler(self, handler: BaseHandler, *, default: bool = False) -> None:
         """
@@ -27,19 +98,32 @@ class HandlerManager:
             handler: Handler instance to register
             default: Whether this handler should be used as the fallback option
         """
+        cls_name = type(handler).__name__
+        if type(handler).can_handle_fast is not BaseHandler.can_handle_fast:
+            predicate, guarded = handler.can_handle_fast, False
+        else:
+            predicate, guarded = handler.can_handle, True
+        entry: _DispatchEntry = (handler, cls_name, predicate, handler.handle, guarded)
         self.handlers.append(handler)
+        self._handler_ids.add(id(handler))
+        self._dispatch_entries.append(entry)
+
+        if handler.path_pattern:
+            self._patterned_handlers.append(handler)
+            self._recompile_dispatch()
+        elif handler.path_prefixes:
+            for prefix in handler.path_prefixes:
+                segment = prefix.strip('/').split('/', 1)[0]
+                self._by_prefix.setdefault(segment, []).append(entry)
+        else:
+            self._wildcard.append(entry)
 
         if default:
             self.default_handler = handler
-            self.logger.info(
-                "Registered default handler",
-                extra={"handler": handler.__class__.__name__},
-            )
+            self._default_entry = entry
+            self.logger.info("Registered default handler", extra={"handler": cls_name})
         else:
-            self.logger.info(
-                "Registered handler",
-                extra={"handler": handler.__class__.__name__},
-            )
+            self.logger.info("Registered handler", extra={"handler": cls_name})
     
     def unregister_handler(self, handler: BaseHandler) -> None:
         """
@@ -48,10 +132,23 @@ class HandlerManager:
         Args:
             handler: Handler instance to unregister
         """
-        if handler in self.handlers:
+        if id(handler) in self._handler_ids:
+            self._handler_ids.discard(id(handler))
             self.handlers.remove(handler)
+            self._dispatch_entries = [e for e in self._dispatch_entries if e[0] is not handler]
+            self._wildcard = [e for e in self._wildcard if e[0] is not handler]
+            for segment, entries in list(self._by_prefix.items()):
+                remaining = [e for e in entries if e[0] is not handler]
+                if remaining:
+                    self._by_prefix[segment] = remaining
+                else:
+                    del self._by_prefix[segment]
             if self.default_handler is handler:
                 self.default_handler = None
+                self._default_entry = None
+            if handler in self._patterned_handlers:
+                self._patterned_handlers.remove(handler)
+                self._recompile_dispatch()
             self.logger.info(
                 "Unregistered handler",
                 extra={"handler": handler.__class__.__name__},
@@ -65,69 +162,135 @@ class HandlerManager:
             event_path: Firebase event path
             event_data: Firebase event data
         """
-        self.logger.debug(f"Processing event at path: {event_path}")
+        self.logger.debug("Processing event at path: %s", event_path)
         
         default_handler = self.default_handler
-        capable_handlers: List[BaseHandler] = []
-        non_default_handlers: List[BaseHandler] = []
+        capable = self._capable_buf
+        non_default = self._nondefault_buf
+        capable.clear()
+        non_default.clear()
 
-        for handler in self.handlers:
+        # One combined regex match covers every handler with a path_pattern
+        if self._dispatch_re is not None:
+            match = self._dispatch_re.match(event_path)
+            if match and match.lastgroup:
+                matched_handler = self._patterned_handlers[int(match.lastgroup[1:])]
+                if matched_handler is not default_handler:
+                    for entry in self._dispatch_entries:
+                        if entry[0] is matched_handler:
+                            non_default.append(entry)
+                            break
+
+        # Consult only handlers registered for the event's first path segment
+        # plus the wildcard handlers, instead of scanning every handler
+        segment = event_path.lstrip('/').split('/', 1)[0]
+        prefixed = self._by_prefix.get(segment)
+        candidates = prefixed + self._wildcard if prefixed else self._wildcard
+
+        default_entry = self._default_entry
+        for entry in candidates:
+            handler, cls_name, predicate, _, guarded = entry
             if handler is default_handler:
                 continue
 
+            if not guarded:
+                if predicate(event_path, event_data):
+                    non_default.append(entry)
+                continue
+
             try:
-                if handler.can_handle(event_path, event_data):
-                    non_default_handlers.append(handler)
+                if predicate(event_path, event_data):
+                    non_default.append(entry)
             except Exception as e:
                 self.logger.error(
-                    f"Error checking if {handler.__class__.__name__} can handle event: {e}",
+                    "Error checking if %s can handle event: %s", cls_name, e,
                     exc_info=True
                 )
 
-        if default_handler is not None:
-            capable_handlers.append(default_handler)
+        if default_entry is not None:
+            capable.append(default_entry)
 
-            if not non_default_handlers:
+            if not non_default:
                 self.logger.info(
                     "Default handler processing event (no specific handlers matched)",
                     extra={
                         "event_path": event_path,
-                        "default_handler": default_handler.__class__.__name__,
+                        "default_handler": default_entry[1],
                     },
                 )
 
-        capable_handlers.extend(non_default_handlers)
+        capable.extend(non_default)
 
-        if not capable_handlers:
-            self.logger.debug(f"No handlers found for event at path: {event_path}")
+        if not capable:
+            self.logger.debug("No handlers found for event at path: %s", event_path)
             return
-        
-        self.logger.info(
-            f"Found {len(capable_handlers)} handler(s) for event at path: {event_path}",
-            extra={
-                'handlers': [h.__class__.__name__ for h in capable_handlers],
-                'event_path': event_path
-            }
-        )
-        
-        # Process event with each capable handler
-        for handler in capable_handlers:
-            try:
-                self.logger.debug(f"Processing event with {handler.__class__.__name__}")
-                handler.handle(event_path, event_data)
-                self.logger.debug(f"Successfully processed event with {handler.__class__.__name__}")
-            except Exception as e:
-                self.logger.error(
-                    f"Error processing event with {handler.__class__.__name__}: {e}",
-                    extra={
-                        'handler': handler.__class__.__name__,
-                        'event_path': event_path,
-                        'error': str(e)
-                    },
-                    exc_info=True
-                )
-                # Continue with other handlers even if one fails
+
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Found %d handler(s) for event at path: %s",
+                len(capable),
+                event_path,
+                extra={
+                    'handlers': [entry[1] for entry in capable],
+                    'event_path': event_path
+                }
+            )
+
+        # Process event with each capable handler via the bound methods
+        # captured at registration, offloading to the pool when one is
+        # configured
+        executor = self._executor
+        for _, cls_name, _, handle, _ in capable:
+            if executor is not None:
+                executor.submit(self._run_handler, cls_name, handle, event_path, event_data)
+            else:
+                self._run_handler(cls_name, handle, event_path, event_data)
+
+    def _run_handler(
+        self,
+        cls_name: str,
+        handle: Callable[[str, Any], None],
+        event_path: str,
+        event_data: Any,
+    ) -> None:
+        """Run one handler for one event, containing any exception it raises."""
+        try:
+            self.logger.debug("Processing event with %s", cls_name)
+            handle(event_path, event_data)
+            self.logger.debug("Successfully processed event with %s", cls_name)
+        except Exception as e:
+            self.logger.error(
+                "Error processing event with %s: %s",
+                cls_name,
+                e,
+                extra={
+                    'handler': cls_name,
+                    'event_path': event_path,
+                    'error': str(e)
+                },
+                exc_info=True
+            )
+            # Other handlers continue even if one fails
     
+    def process_events(self, events: List[tuple]) -> None:
+        """
+        Process a batch of Firebase events through registered handlers.
+
+        Draining several queued events in one call amortizes dispatch overhead
+        when Firebase SSE delivers bursts of patch events back-to-back.
+
+        Args:
+            events: List of (event_path, event_data) tuples
+        """
+        if not events:
+            return
+
+        if len(events) > 1:
+            self.logger.debug("Processing batch of %d events", len(events))
+
+        for event_path, event_data in events:
+            self.process_event(event_path, event_data)
+
     def get_handler_info(self) -> List[dict]:
         """
         Get information about registered handlers.
@@ -145,9 +308,21 @@ class HandlerManager:
             for handler in self.handlers
         ]
     
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the handler thread pool, if one was configured."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+
     def clear_handlers(self) -> None:
         """Clear all registered handlers."""
         handler_count = len(self.handlers)
         self.handlers.clear()
+        self._handler_ids.clear()
         self.default_handler = None
-        self.logger.info(f"Cleared {handler_count} handler(s)")
\ No newline at end of file
+        self._patterned_handlers.clear()
+        self._dispatch_re = None
+        self._dispatch_entries.clear()
+        self._by_prefix.clear()
+        self._wildcard.clear()
+        self._default_entry = None
+        self.logger.info("Cleared %d handler(s)", handler_count)
\ No newline at end of file
@@ -3,20 +3,85 @@
 from __future__ import annotations
 
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
 from typing import Any, Dict
+from weakref import WeakValueDictionary
 
 from kommo_command.models.session import SessionCreateRequest
 
 from .base_handler import BaseHandler
 from ..models import LeadModel
-from ..types import COMMAND_LIST, BotID, Command
+from ..types import COMMAND_SET, BotID, Command
 
 logger = logging.getLogger(__name__)
 
+# Enum .value resolution is a descriptor call; these bot IDs are constants,
+# so resolve them once at import time
+_LANG_SELECT_BOT = BotID.LANG_SELECT_BOT_ID.value
+_REPLY_CUSTOM_BOT = BotID.REPLY_CUSTOM_BOT_ID.value
+
+# Language-selection button labels mapped to language codes; the frozenset
+# gives O(1) membership tests on the hot path without rebuilding a literal
+_LANG_MAP = {"🇮🇩 Bahasa": "ID", "🇬🇧 English": "EN"}
+_LANG_MESSAGES = frozenset(_LANG_MAP)
+
+# Constant part of the custom-fields payload sent back to Kommo; only the
+# per-event values list is built in handle()
+_CUSTOM_FIELD_TEMPLATE = {
+    "field_id": 1069656,
+    "field_name": "Custom Message",
+    "field_code": None,
+    "field_type": "textarea",
+}
+
 
 class IncomingLeadHandler(BaseHandler):
     """Handler for processing incoming lead events."""
-    
+
+    # BaseHandler declares __slots__; extending it here keeps this handler
+    # fully slotted so hot attribute reads in handle() skip the __dict__
+    __slots__ = (
+        "_entity_locks",
+        "_entity_locks_guard",
+        "_cleanup_executor",
+        "_lead_entity_type",
+    )
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Kommo entity-type code for leads, memoized on first use
+        self._lead_entity_type: str | None = None
+        # Per-entity locks used to serialize session work for the same lead
+        # when HandlerManager runs handlers concurrently. Weak values bound
+        # the map without a sweep: an entry lives exactly as long as some
+        # caller still holds its lock object
+        self._entity_locks: "WeakValueDictionary[int, threading.Lock]" = WeakValueDictionary()
+        self._entity_locks_guard = threading.Lock()
+        # Single worker for fire-and-forget Realtime DB cleanup; handle()
+        # does not depend on the delete completing
+        self._cleanup_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="rtdb-cleanup"
+        )
+
+    def _get_entity_lock(self, entity_id: int) -> threading.Lock:
+        """Return the lock serializing session work for this entity."""
+        with self._entity_locks_guard:
+            lock = self._entity_locks.get(entity_id)
+            if lock is None:
+                lock = threading.Lock()
+                self._entity_locks[entity_id] = lock
+            return lock
+
+    def _lead_entity_type_code(self) -> str:
+        """Return the Kommo entity-type code for leads ('2'), resolved once."""
+        code = self._lead_entity_type
+        if code is None:
+            code = self.kommo_service.get_entity_type_code('lead')
+            self._lead_entity_type = code
+        return code
+
     def can_handle(self, event_path: str, event_data: Any) -> bool:
         """
         Check if this handler can process the given event.
@@ -34,21 +99,25 @@ class IncomingLeadHandler(BaseHandler):
         """
         # Check if data is not empty/null
         if not event_data:
-            self.logger.debug(f"Skipping event with empty data at path: {event_path}")
+            self.logger.debug("Skipping event with empty data at path: %s", event_path)
             return False
         
         # Check if data is a dictionary (structured data)
         if not isinstance(event_data, dict):
-            self.logger.debug(f"Skipping event with non-dict data at path: {event_path}")
+            self.logger.debug("Skipping event with non-dict data at path: %s", event_path)
             return False
         
         # You can add more specific path matching logic here
         # For example, only handle events from certain paths like '/leads/', '/incoming/', etc.
         # For now, we'll handle any structured data
         
-        self.logger.debug(f"Handler can process event at path: {event_path}")
+        self.logger.debug("Handler can process event at path: %s", event_path)
         return True
-    
+
+    def can_handle_fast(self, event_path: str, event_data: Any) -> bool:
+        """Non-raising predicate equivalent of can_handle, minus the logging."""
+        return bool(event_data) and isinstance(event_data, dict)
+
     def detect_language(self, message: str) -> str | None:
         """
         Detect language from message based on specific patterns.
@@ -59,15 +128,66 @@ class IncomingLeadHandler(BaseHandler):
         Returns:
             Language code ('ID' for Indonesian, 'EN' for English) or None if not detected
         """
-        if message == "🇮🇩 Bahasa":
-            return "ID"
-        elif message == "🇬🇧 English":
-            return "EN"
-        else:
-            return None
+        return _LANG_MAP.get(message)
     
     def is_command(self, user_message: str) -> bool:
-        return user_message in COMMAND_LIST
+        return user_message in COMMAND_SET
+
+    def _parse_event(self, event_data: Dict[str, Any]) -> tuple[int | None, str]:
+        """
+        Extract entity_id and the stripped message from event data in one pass.
+
+        Returns:
+            (entity_id, messages) where entity_id is None when absent or not
+            coercible to an int, and messages is '' when missing/blank
+        """
+        # int() handles both the int passthrough and the str conversion, so
+        # one try covers the common cases without an isinstance pre-check
+        eid = event_data.get('entity_id')
+        entity_id = None
+        if eid:
+            try:
+                entity_id = int(eid)
+            except (TypeError, ValueError):
+                self.logger.warning("Invalid entity_id format: %s, skipping session lookup", eid)
+        raw_messages = event_data.get('messages')
+        messages = raw_messages.strip() if raw_messages else ''
+        return entity_id, messages
+
+    def _log_cleanup_result(
+        self, future: Future, lead_id: str, source_path: str, data_size: int
+    ) -> None:
+        """Log the outcome of a background Realtime DB cleanup delete."""
+        try:
+            delete_success = future.result()
+        except Exception as e:
+            self.logger.error(
+                "Error deleting source data for lead %s: %s",
+                lead_id,
+                e,
+                extra={'lead_id': lead_id, 'source_path': source_path}
+            )
+            return
+
+        if delete_success:
+            self.logger.info(
+                "Successfully processed lead %s and cleaned up source data",
+                lead_id,
+                extra={
+                    'lead_id': lead_id,
+                    'source_path': source_path,
+                    'data_size': data_size
+                }
+            )
+        else:
+            self.logger.warning(
+                "Lead %s saved to Firestore but failed to delete from Realtime DB",
+                lead_id,
+                extra={
+                    'lead_id': lead_id,
+                    'source_path': source_path
+                }
+            )
 
     def handle(self, event_path: str, event_data: Any) -> None:
         """
@@ -83,8 +203,23 @@ class IncomingLeadHandler(BaseHandler):
             event_data: Firebase event data
         """
         try:
-            self.logger.info(f"Processing incoming lead from path: {event_path}")
-            
+            # Bind hot attributes once; LOAD_FAST beats repeated LOAD_ATTR
+            logger = self.logger
+            firestore_service = self.firestore_service
+            kommo_service = self.kommo_service
+            logger.info("Processing incoming lead from path: %s", event_path)
+
+            # Extract and validate the interesting fields up front, before any
+            # model construction or Firestore work
+            entity_id, messages = self._parse_event(event_data)
+
+            # Firestore writes produced along the way; committed together in
+            # one WriteBatch at the end of the happy path
+            pending_writes: list[tuple[str, str, Dict[str, Any]]] = []
+            # Session queued in pending_writes; logged and cached only once
+            # the batch actually commits
+            created_session = None
+
             # Create lead model from event data
             lead = LeadModel.from_firebase_event(
                 event_path=event_path,
@@ -94,258 +229,262 @@ class IncomingLeadHandler(BaseHandler):
                     'processed_at': None  # Will be set when marked as processed
                 }
             )
-
-            # Get entity id from lead data
-            entity_id = event_data.get('entity_id')
-            messages = event_data.get('messages', '').strip() if event_data.get('messages') else ''
-            
-            # Convert entity_id to int if it's a string
-            if entity_id and isinstance(entity_id, str):
-                try:
-                    entity_id = int(entity_id)
-                except ValueError:
-                    self.logger.warning(f"Invalid entity_id format: {entity_id}, skipping session lookup")
-                    entity_id = None
             
-            # If entity id is present, get session from firestore with entity id
-            session = None
-            if entity_id:
-                try:
-                    session = self.firestore_service.get_latest_session_by_entity_id(entity_id)
-                    if session:
-                        self.logger.info(
-                            f"Found existing session for entity {entity_id}: {session.session_id}",
-                            extra={
-                                'entity_id': entity_id,
-                                'session_id': session.session_id,
-                                'session_language': session.language
-                            }
-                        )
-                        # Add session info to lead metadata
-                        lead.metadata['session_id'] = session.session_id
-                        lead.metadata['session_language'] = session.language
-                    else:
-                        # Launch salesbot if no session found
-                        if self.kommo_service:
-                            try:
-                                # Launch salesbot with bot_id 66624 for the lead
-                                entity_type = self.kommo_service.get_entity_type_code('lead')  # '2' for lead
-                                salesbot_result = self.kommo_service.launch_salesbot(
-                                    bot_id=BotID.LANG_SELECT_BOT_ID.value,
-                                    entity_id=entity_id,
-                                    entity_type=entity_type
-                                )
-                                
-                                self.logger.info(
-                                    f"Successfully launched salesbot 66624 for lead {entity_id}",
-                                    extra={
-                                        'entity_id': entity_id,
-                                        'bot_id': BotID.LANG_SELECT_BOT_ID.value,
-                                        'salesbot_result': salesbot_result
-                                    }
-                                )
-                                
-                                # Create a new session record for this lead
-                                session_request = SessionCreateRequest(
-                                                    entity_id=entity_id,
-                                                    language=None,  # Language will be detected later
-                                                    command=Command.MAIN_MENU,  # Default to main menu
-                                                    expires_in_hours=24,
-                                                )
+            # Serialize session reads and writes per entity so concurrent
+            # events for the same lead cannot race when handlers run on a
+            # thread pool; different leads proceed in parallel
+            lock = self._get_entity_lock(entity_id) if entity_id else nullcontext()
+            with lock:
+                # If entity id is present, get session from firestore with entity id
+                session = None
+                if entity_id:
+                    try:
+                        session = firestore_service.get_latest_session_by_entity_id(entity_id)
+                        if session:
+                            logger.info(
+                                "Found existing session for entity %s: %s",
+                                entity_id,
+                                session.session_id,
+                                extra={
+                                    'entity_id': entity_id,
+                                    'session_id': session.session_id,
+                                    'session_language': session.language
+                                }
+                            )
+                            # Add session info to lead metadata
+                            lead.metadata['session_id'] = session.session_id
+                            lead.metadata['session_language'] = session.language
+                        else:
+                            # Launch salesbot if no session found
+                            if kommo_service:
+                                try:
+                                    # Launch salesbot with bot_id 66624 for the lead
+                                    entity_type = self._lead_entity_type_code()  # '2' for lead
+                                    salesbot_result = kommo_service.launch_salesbot(
+                                        bot_id=_LANG_SELECT_BOT,
+                                        entity_id=entity_id,
+                                        entity_type=entity_type
+                                    )
                                 
-                                # Save the new session to Firestore
-                                session_success = self.firestore_service.create_session(session_request)
-
-                                if session_success:
-                                    self.logger.info(
-                                        f"Created new session {session_success.session_id} for lead {entity_id}",
+                                    logger.info(
+                                        "Successfully launched salesbot 66624 for lead %s",
+                                        entity_id,
                                         extra={
                                             'entity_id': entity_id,
-                                            'session_id': session_success.session_id,
-                                            'lead_id': lead.lead_id
+                                            'bot_id': _LANG_SELECT_BOT,
+                                            'salesbot_result': salesbot_result
                                         }
                                     )
-                                    
+                                
+                                    # Create a new session record for this lead
+                                    session_request = SessionCreateRequest(
+                                                        entity_id=entity_id,
+                                                        language=None,  # Language will be detected later
+                                                        command=Command.MAIN_MENU,  # Default to main menu
+                                                        expires_in_hours=24,
+                                                    )
+                                
+                                    # Defer the session write so it
+                                    # commits in the same batch as the lead
+                                    # save below; the metadata rides in that
+                                    # same batch, so the two stay consistent
+                                    created_session = session_request.to_session_model()
+                                    pending_writes.append((
+                                        'sessions',
+                                        created_session.session_id,
+                                        created_session.to_firestore_dict(),
+                                    ))
+
                                     # Add session info to lead metadata
                                     lead.metadata['new_session_created'] = True
-                                    lead.metadata['new_session_id'] = session_success.session_id
-                                else:
-                                    self.logger.error(
-                                        f"Failed to create session for lead {entity_id}",
-                                        extra={'entity_id': entity_id, 'lead_id': lead.lead_id}
-                                    )
+                                    lead.metadata['new_session_id'] = created_session.session_id
                                 
-                            except Exception as e:
-                                self.logger.error(
-                                    f"Something wrong happened: {e}",
-                                    extra={
-                                        'entity_id': entity_id,
-                                        'bot_id': BotID.LANG_SELECT_BOT_ID.value,
-                                        'error': str(e)
-                                    }
-                                )
-                                # Add failed launch info to lead metadata
-                                lead.metadata['salesbot_launched'] = False
-                                lead.metadata['salesbot_error'] = str(e)
-                        else:
-                            if not self.kommo_service:
-                                self.logger.warning("Kommo service not available, cannot launch salesbot")
-                            if not entity_id:
-                                self.logger.warning("No entity_id provided, cannot launch salesbot")
-
-                        self.logger.debug(f"No active session found for entity {entity_id}")
-                except Exception as e:
-                    self.logger.warning(
-                        f"Error retrieving session for entity {entity_id}: {e}",
-                        extra={'entity_id': entity_id, 'error': str(e)}
-                    )
-
-            self.logger.info(f"Process Message: {messages}")
-            # If message is not empty or whitespace and session exists, check for language detection
-            if messages and session:
-                # If session has no language set or language is empty, attempt to detect language from messages
-                if not session.language or session.language.strip() == "":
-                    try:
-                        if messages in ["🇮🇩 Bahasa", "🇬🇧 English"]:
-                            detected_language = self.detect_language(messages)
-                            if detected_language:
-                                session.set_language(detected_language)
-                                self.save_to_firestore(
-                                    collection='sessions',
-                                    document_id=session.session_id,
-                                    data=session.to_firestore_dict()
-                                )
-                                self.logger.info(
-                                    f"Detected and set language '{detected_language}' for session {session.session_id}",
-                                    extra={
-                                        'entity_id': entity_id,
-                                        'session_id': session.session_id,
-                                        'detected_language': detected_language
-                                    }
-                                )
-                                # Add detected language to lead metadata
-                                lead.metadata['detected_language'] = detected_language
+                                except Exception as e:
+                                    logger.error(
+                                        "Something wrong happened: %s",
+                                        e,
+                                        extra={
+                                            'entity_id': entity_id,
+                                            'bot_id': _LANG_SELECT_BOT,
+                                            'error': str(e)
+                                        }
+                                    )
+                                    # Add failed launch info to lead metadata
+                                    lead.metadata['salesbot_launched'] = False
+                                    lead.metadata['salesbot_error'] = str(e)
                             else:
-                                self.logger.warning(
-                                    f"Failed to detect language from message for session {session.session_id}",
-                                    extra={
-                                        'entity_id': entity_id,
-                                        'session_id': session.session_id,
-                                        'message_preview': messages[:50] + '...' if len(messages) > 50 else messages
-                                    }
-                                )
+                                if not kommo_service:
+                                    logger.warning("Kommo service not available, cannot launch salesbot")
+                                if not entity_id:
+                                    logger.warning("No entity_id provided, cannot launch salesbot")
+
+                            logger.debug("No active session found for entity %s", entity_id)
                     except Exception as e:
-                        self.logger.error(
-                            f"Error detecting language from message for session {session.session_id}: {e}",
-                            extra={
-                                'entity_id': entity_id,
-                                'session_id': session.session_id,
-                                'error': str(e)
-                            },
-                            exc_info=True
+                        logger.warning(
+                            "Error retrieving session for entity %s: %s",
+                            entity_id,
+                            e,
+                            extra={'entity_id': entity_id, 'error': str(e)}
                         )
-                
-                # If session already has a language and messages is not empty, check if message is a command
-                elif session.language and self.is_command(messages):
-                    self.logger.info(
-                        f"Message is a recognized command '{messages}' for session {session.session_id}",
-                        extra={
-                            'entity_id': entity_id,
-                            'session_id': session.session_id,
-                            'current_language': session.language
-                        }
-                    )
 
-                    if self.kommo_service and entity_id is not None:
-                        custom_fields = [
-                            {
-                                "field_id": 1069656,
-                                "field_name": "Custom Message",
-                                "field_code": None,
-                                "field_type": "textarea",
-                                "values": [{ "value": messages }]
-                            }
-                        ]
-                        results_update_custom_fields = self.kommo_service.update_lead_custom_fields(entity_id, custom_fields)
-                        self.logger.info(
-                            f"Updated lead {entity_id} custom fields with command message",
+                logger.info("Process Message: %s", messages)
+                # If message is not empty or whitespace and session exists, check for language detection
+                if messages and session:
+                    # If session has no language set or language is empty, attempt to detect language from messages
+                    if not session.language or session.language.strip() == "":
+                        try:
+                            if messages in _LANG_MESSAGES:
+                                detected_language = _LANG_MAP.get(messages)
+                                if detected_language:
+                                    session.set_language(detected_language)
+                                    pending_writes.append((
+                                        'sessions',
+                                        session.session_id,
+                                        session.to_firestore_dict(),
+                                    ))
+                                    logger.info(
+                                        "Detected and set language '%s' for session %s",
+                                        detected_language,
+                                        session.session_id,
+                                        extra={
+                                            'entity_id': entity_id,
+                                            'session_id': session.session_id,
+                                            'detected_language': detected_language
+                                        }
+                                    )
+                                    # Add detected language to lead metadata
+                                    lead.metadata['detected_language'] = detected_language
+                                else:
+                                    logger.warning(
+                                        "Failed to detect language from message for session %s",
+                                        session.session_id,
+                                        extra={
+                                            'entity_id': entity_id,
+                                            'session_id': session.session_id,
+                                            'message_preview': messages[:50] + '...' if len(messages) > 50 else messages
+                                        }
+                                    )
+                        except Exception as e:
+                            logger.error(
+                                "Error detecting language from message for session %s: %s",
+                                session.session_id,
+                                e,
+                                extra={
+                                    'entity_id': entity_id,
+                                    'session_id': session.session_id,
+                                    'error': str(e)
+                                },
+                                exc_info=True
+                            )
+                
+                    # If session already has a language and messages is not empty, check if message is a command
+                    elif session.language and self.is_command(messages):
+                        logger.info(
+                            "Message is a recognized command '%s' for session %s",
+                            messages,
+                            session.session_id,
                             extra={
                                 'entity_id': entity_id,
                                 'session_id': session.session_id,
-                                'command_message': messages,
-                                'update_results': results_update_custom_fields
+                                'current_language': session.language
                             }
                         )
 
-                        if results_update_custom_fields:
-                            entity_type = self.kommo_service.get_entity_type_code('lead')  # '2' for lead
-                            salesbot_result = self.kommo_service.launch_salesbot(
-                                            bot_id=BotID.REPLY_CUSTOM_BOT_ID.value,
-                                            entity_id=entity_id,
-                                            entity_type=entity_type
-                                        )
-                            self.logger.info(
-                                            f"Successfully launched salesbot {BotID.REPLY_CUSTOM_BOT_ID.value} for lead {entity_id}",
-                                            extra={
-                                                'entity_id': entity_id,
-                                                'bot_id': BotID.REPLY_CUSTOM_BOT_ID.value,
-                                                'salesbot_result': salesbot_result
-                                            }
-                                        )
-                    else:
-                        if not self.kommo_service:
-                            self.logger.warning("Kommo service not available, cannot update custom fields")
-                        if entity_id is None:
-                            self.logger.warning(
-                                f"Cannot update custom fields for lead because entity_id is None",
+                        if kommo_service and entity_id is not None:
+                            custom_fields = [
+                                {**_CUSTOM_FIELD_TEMPLATE, "values": [{"value": messages}]}
+                            ]
+                            results_update_custom_fields = kommo_service.update_lead_custom_fields(entity_id, custom_fields)
+                            logger.info(
+                                "Updated lead %s custom fields with command message",
+                                entity_id,
                                 extra={
+                                    'entity_id': entity_id,
                                     'session_id': session.session_id,
-                                    'command_message': messages
+                                    'command_message': messages,
+                                    'update_results': results_update_custom_fields
                                 }
                             )
-            
-            
-            # Save to Firestore leads collection
-            lead.mark_as_processed()  # Mark as processed before saving
-            success = self.save_to_firestore(
-                collection='leads',
-                document_id=lead.lead_id,
-                data=lead.to_firestore_dict()
-            )
-            
-            if success:
-                # Delete from Realtime Database
-                delete_success = self.delete_realtime_data(event_path)
-                
-                if delete_success:
-                    self.logger.info(
-                        f"Successfully processed lead {lead.lead_id} and cleaned up source data",
-                        extra={
-                            'lead_id': lead.lead_id,
-                            'source_path': event_path,
-                            'data_size': len(str(event_data))
-                        }
+
+                            if results_update_custom_fields:
+                                entity_type = self._lead_entity_type_code()  # '2' for lead
+                                salesbot_result = kommo_service.launch_salesbot(
+                                                bot_id=_REPLY_CUSTOM_BOT,
+                                                entity_id=entity_id,
+                                                entity_type=entity_type
+                                            )
+                                logger.info(
+                                                "Successfully launched salesbot %s for lead %s",
+                                                _REPLY_CUSTOM_BOT,
+                                                entity_id,
+                                                extra={
+                                                    'entity_id': entity_id,
+                                                    'bot_id': _REPLY_CUSTOM_BOT,
+                                                    'salesbot_result': salesbot_result
+                                                }
+                                            )
+                        else:
+                            if not kommo_service:
+                                logger.warning("Kommo service not available, cannot update custom fields")
+                            if entity_id is None:
+                                logger.warning(
+                                    "Cannot update custom fields for lead because entity_id is None",
+                                    extra={
+                                        'session_id': session.session_id,
+                                        'command_message': messages
+                                    }
+                                )
+
+                # Commit the lead save plus any deferred session writes in a
+                # single WriteBatch: one RPC instead of up to three. This
+                # stays inside the entity lock so a concurrent event for the
+                # same lead cannot observe "no session" between our session
+                # decision and the commit landing
+                lead.mark_as_processed()  # Mark as processed before saving
+                pending_writes.append(('leads', lead.lead_id, lead.to_firestore_dict()))
+                success = firestore_service.batch_write(pending_writes)
+
+                if success:
+                    if created_session is not None:
+                        # The deferred write bypassed create_session's
+                        # write-through; seed the read cache so the next
+                        # message event for this lead avoids a cold read
+                        firestore_service.cache_session(created_session)
+                        logger.info(
+                            "Created new session %s for lead %s",
+                            created_session.session_id,
+                            entity_id,
+                            extra={
+                                'entity_id': entity_id,
+                                'session_id': created_session.session_id,
+                                'lead_id': lead.lead_id
+                            }
+                        )
+
+                    # Delete from Realtime Database off the critical path;
+                    # the outcome is logged from the completion callback
+                    future = self._cleanup_executor.submit(self.delete_realtime_data, event_path)
+                    future.add_done_callback(
+                        lambda f, lead_id=lead.lead_id, path=event_path, size=len(event_data):
+                            self._log_cleanup_result(f, lead_id, path, size)
                     )
                 else:
-                    self.logger.warning(
-                        f"Lead {lead.lead_id} saved to Firestore but failed to delete from Realtime DB",
+                    # Cold path: stringify the payload once for the preview
+                    preview = str(event_data)
+                    logger.error(
+                        "Failed to save lead to Firestore from path: %s",
+                        event_path,
                         extra={
-                            'lead_id': lead.lead_id,
-                            'source_path': event_path
+                            'source_path': event_path,
+                            'data_preview': preview[:200] + '...' if len(preview) > 200 else preview
                         }
                     )
-            else:
-                self.logger.error(
-                    f"Failed to save lead to Firestore from path: {event_path}",
-                    extra={
-                        'source_path': event_path,
-                        'data_preview': str(event_data)[:200] + '...' if len(str(event_data)) > 200 else str(event_data)
-                    }
-                )
                 
         except Exception as e:
-            self.logger.error(
-                f"Error processing incoming lead from path {event_path}: {e}",
+            logger.error(
+                "Error processing incoming lead from path %s: %s",
+                event_path,
+                e,
                 extra={
                     'source_path': event_path,
                     'error': str(e)
@@ -364,13 +503,13 @@ class IncomingLeadHandler(BaseHandler):
         """
         try:
             leads_collection = self.firestore_service.get_collection_reference('leads')
-            
-            # Count total leads
-            total_leads = len(list(leads_collection.stream()))
-            
-            # Count processed leads
+
+            # Use server-side count() aggregations instead of streaming every
+            # document just to measure the collection size
+            total_leads = leads_collection.count().get()[0][0].value
+
             processed_query = leads_collection.where('processed', '==', True)
-            processed_leads = len(list(processed_query.stream()))
+            processed_leads = processed_query.count().get()[0][0].value
             
             # Count unprocessed leads
             unprocessed_leads = total_leads - processed_leads
@@ -386,7 +525,7 @@ class IncomingLeadHandler(BaseHandler):
             return stats
             
         except Exception as e:
-            self.logger.error(f"Error retrieving lead statistics: {e}")
+            self.logger.error("Error retrieving lead statistics: %s", e)
             return {
                 'total_leads': 0,
                 'processed_leads': 0,
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import re
-from typing import Any
+import string
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict
 
 from .base_handler import BaseHandler
 from ..models.session import SessionModel, SessionUpdateRequest
@@ -12,6 +15,54 @@ from ..types import BotID, AppState, AppLanguage, Command
 from ..services import LoveBaliAPIError
 
 
+@lru_cache(maxsize=None)
+def _template_fn(template: str) -> Callable[[Dict[str, str]], str]:
+    """
+    Compile a .format-style template into a render closure.
+
+    The template is parsed once with string.Formatter and subsequent calls
+    just join its literal and substituted segments, skipping the per-call
+    format-string parse that str.format(**params) performs. Raises
+    ValueError for malformed templates, and the closure raises KeyError for
+    missing params, matching str.format.
+    """
+    segments = list(string.Formatter().parse(template))
+
+    def render(params: Dict[str, str]) -> str:
+        return "".join(
+            literal + (params[field] if field else "")
+            for literal, field, _, _ in segments
+        )
+
+    return render
+
+
+# Enum .value reads resolved once at import instead of per event/per message
+_REPLY_BOT_ID = BotID.REPLY_CUSTOM_BOT_ID.value
+_LANG_EN = AppLanguage.ENGLISH.value
+_STATE_INITIAL = AppState.INITIAL.value
+_STATE_AWAITING = AppState.AWAITING_PASSPORT_NUMBER.value
+# Main-menu bot per language; anything but English falls back to Indonesian
+_MENU_BOT = {_LANG_EN: BotID.MAIN_MENU_EN_BOT_ID.value}
+_MENU_BOT_DEFAULT = BotID.MAIN_MENU_ID_BOT_ID.value
+
+# Static part of the custom-field payload sent with every outgoing message;
+# per call only the values list is fresh (the template itself is never
+# mutated, so sharing the other entries is safe)
+_FIELD_TEMPLATE = {
+    "field_id": 1069656,
+    "field_name": "Custom Message",
+    "field_code": None,
+    "field_type": "textarea",
+}
+
+# Single-pass passport normalization: delete spaces/dashes and uppercase
+# ASCII letters in one str.translate call instead of strip/upper/replace x2
+_PASSPORT_TRANS = str.maketrans(
+    {" ": None, "-": None, **{chr(c): chr(c - 32) for c in range(ord('a'), ord('z') + 1)}}
+)
+
+
 class IncomingMessageHandler(BaseHandler):
     """Handler that logs incoming messages from Firebase to the console."""
 
@@ -19,6 +70,41 @@ class IncomingMessageHandler(BaseHandler):
     DEFAULT_ENTITY_TYPE = "2"
     PASSPORT_ALLOWED_PATTERN = re.compile(r"^[A-Z0-9]{6,12}$")
 
+    # Kommo entity-type code for leads, memoized per instance on first use
+    # (the instance attribute set in _lead_entity_type_code shadows this)
+    _lead_entity_type: str | None = None
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Single worker for fire-and-forget Realtime DB cleanup; handle()
+        # does not depend on the delete completing
+        self._cleanup_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="rtdb-cleanup"
+        )
+
+    def _log_cleanup_result(self, future: Future, source_path: str) -> None:
+        """Log the outcome of a background Realtime DB cleanup delete."""
+        try:
+            if future.result():
+                self.logger.info("Successfully deleted realtime data at path %s", source_path)
+        except Exception as e:
+            self.logger.error(
+                "Error deleting realtime data at path %s: %s", source_path, e,
+                extra={
+                    'source_path': source_path,
+                    'error': str(e)
+                },
+                exc_info=True
+            )
+
+    def _lead_entity_type_code(self) -> str:
+        """Return the Kommo entity-type code for leads ('2'), resolved once."""
+        code = self._lead_entity_type
+        if code is None:
+            code = self.kommo_service.get_entity_type_code('lead')
+            self._lead_entity_type = code
+        return code
+
     def can_handle(self, event_path: str, event_data: Any) -> bool:
         """
         Check if this handler can process the given event.
@@ -36,21 +122,47 @@ class IncomingMessageHandler(BaseHandler):
         """
         # Check if data is not empty/null
         if not event_data:
-            self.logger.debug(f"Skipping event with empty data at path: {event_path}")
+            self.logger.debug("Skipping event with empty data at path: %s", event_path)
             return False
         
         # Check if data is a dictionary (structured data)
         if not isinstance(event_data, dict):
-            self.logger.debug(f"Skipping event with non-dict data at path: {event_path}")
+            self.logger.debug("Skipping event with non-dict data at path: %s", event_path)
             return False
         
         # You can add more specific path matching logic here
         # For example, only handle events from certain paths like '/leads/', '/incoming/', etc.
         # For now, we'll handle any structured data
         
-        self.logger.debug(f"Handler can process event at path: {event_path}")
+        self.logger.debug("Handler can process event at path: %s", event_path)
         return True
 
+    def can_handle_fast(self, event_path: str, event_data: Any) -> bool:
+        """Non-raising predicate equivalent of can_handle, minus the logging."""
+        return bool(event_data) and isinstance(event_data, dict)
+
+    def _parse_event(self, event_data: dict) -> tuple[int | None, str, str, str]:
+        """
+        Extract entity_id, message, language and state in a single pass.
+
+        Returns:
+            (entity_id, user_messages, user_lang, app_state) with entity_id
+            None when absent or not coercible to an int, and blank values
+            replaced by the language/state defaults
+        """
+        eid = event_data.get('entity_id')
+        entity_id = None
+        if eid:
+            try:
+                entity_id = int(eid)
+            except (TypeError, ValueError):
+                self.logger.warning("Invalid entity_id format: %s, skipping session lookup", eid)
+        raw_messages = event_data.get('messages')
+        user_messages = raw_messages.strip() if isinstance(raw_messages, str) else ''
+        user_lang = event_data.get('language') or _LANG_EN
+        app_state = event_data.get('state') or _STATE_INITIAL
+        return entity_id, user_messages, user_lang, app_state
+
     def handle(self, event_path: str, event_data: Any) -> None:
         """
         Handle the incoming message when user click Love Bali Menu.
@@ -60,78 +172,70 @@ class IncomingMessageHandler(BaseHandler):
         """
         try:
             
-            self.logger.info(f"Processing incoming message for Love Bali Command: {event_path}")
-
-            if event_data is None:
-                self.logger.info(
-                    "Skipping incoming message with no data",
-                    extra={"event_path": event_path},
-                )
-                return
-
+            # Bind hot attributes once; LOAD_FAST beats repeated LOAD_ATTR
+            logger = self.logger
+            firestore_service = self.firestore_service
+            logger.info("Processing incoming message for Love Bali Command: %s", event_path)
+
+            # Single type check narrows the payload for everything below;
+            # dispatch via HandlerManager has already run can_handle_fast, so
+            # this only matters for direct calls (None fails the isinstance)
             if not isinstance(event_data, dict):
-                self.logger.warning(
+                logger.warning(
                     "Skipping incoming message with non-dict payload",
                     extra={"event_path": event_path, "payload_type": type(event_data).__name__},
                 )
                 return
 
-            # Get entity id from lead data
-            entity_id = event_data.get('entity_id')
-            user_messages = event_data.get('messages', '').strip() if event_data.get('messages') else ''
-            user_lang = event_data.get('language', AppLanguage.ENGLISH.value)
-            app_state = event_data.get('state', AppState.INITIAL.value)
-
-
-            # Convert entity_id to int if it's a string
-            if entity_id and isinstance(entity_id, str):
-                try:
-                    entity_id = int(entity_id)
-                except ValueError:
-                    self.logger.warning(f"Invalid entity_id format: {entity_id}, skipping session lookup")
-                    entity_id = None
+            # Extract all interesting fields in one pass
+            entity_id, user_messages, user_lang, app_state = self._parse_event(event_data)
             
-            # Define session variable
-            session: SessionModel | None = None
             if entity_id:
-                try:
-                    session = self.firestore_service.get_active_session_for_entity(entity_id)
-                except Exception as exc:
-                    self.logger.error(
-                        f"Failed to retrieve session for entity_id {entity_id}: {exc}",
-                        extra={"entity_id": entity_id}
-                    )
-
-                if not session:
-                    self.logger.info(f"No session found for entity_id: {entity_id}")
-                
-                self.logger.debug(f"Start checking app_state {app_state} for entity_id: {entity_id}")
+                # One base extra dict per event; per-log deltas are merged in
+                # with | instead of rebuilding the common keys each call
+                base_extra = {"entity_id": entity_id, "event_path": event_path}
+                logger.debug("Start checking app_state %s for entity_id: %s", app_state, entity_id)
 
                 # Process event based on app_state
-                self.logger.debug(f"Checking app_state: {app_state} with : {AppState.INITIAL.value}")
-                if app_state == AppState.INITIAL.value: 
-                    self.logger.info(f"Processing app_state: {app_state} for entity_id: {entity_id}")    
+                logger.debug("Checking app_state: %s with : %s", app_state, _STATE_INITIAL)
+                if app_state == _STATE_INITIAL:
+                    logger.info("Processing app_state: %s for entity_id: %s", app_state, entity_id)
                     custom_message = get_message(MessageKey.PASSPORT_PROMPT, language=user_lang)
                     self.send_message(entity_id=entity_id, message=custom_message)
 
-                self.logger.debug(f"Checking app_state: {app_state} with : {AppState.AWAITING_PASSPORT_NUMBER.value}")
-                if app_state == AppState.AWAITING_PASSPORT_NUMBER.value:
-                    self.logger.info(f"Awaiting passport number from entity_id: {entity_id}")
+                logger.debug("Checking app_state: %s with : %s", app_state, _STATE_AWAITING)
+                if app_state == _STATE_AWAITING:
+                    logger.info("Awaiting passport number from entity_id: %s", entity_id)
+
+                    # The session is only consulted on this branch, so the
+                    # Firestore lookup is deferred here; INITIAL-state events
+                    # skip the round-trip entirely
+                    session: SessionModel | None = None
+                    try:
+                        session = firestore_service.get_active_session_for_entity(entity_id)
+                    except Exception as exc:
+                        logger.error(
+                            "Failed to retrieve session for entity_id %s: %s", entity_id, exc,
+                            extra=base_extra
+                        )
+
+                    if not session:
+                        logger.info("No session found for entity_id: %s", entity_id)
 
                     normalized_passport = self.normalize_passport_number(user_messages)
 
                     if not normalized_passport or not self.is_valid_passport_number(normalized_passport, normalized=True):
-                        self.logger.warning(
-                            f"Invalid passport number format received: {user_messages}",
-                            extra={"entity_id": entity_id},
+                        logger.warning(
+                            "Invalid passport number format received: %s", user_messages,
+                            extra=base_extra,
                         )
                         invalid_message = get_message(MessageKey.PASSPORT_INVALID, language=user_lang)
                         self.send_message(entity_id=entity_id, message=invalid_message)
                     else:
                         if not self.love_bali_service:
-                            self.logger.warning(
+                            logger.warning(
                                 "Love Bali service unavailable; skipping passport scan",
-                                extra={"entity_id": entity_id},
+                                extra=base_extra,
                             )
                         else:
                             isError = False
@@ -144,15 +248,12 @@ class IncomingMessageHandler(BaseHandler):
                                 "expired_date": "-",
                             }
                             response_message: str | None = None
+                            scan_extra = base_extra | {"passport_number": normalized_passport}
                             try:
                                 scan_result = self.love_bali_service.single_scan_passport(normalized_passport)
-                                self.logger.info(
-                                    f"Love Bali passport scan completed with result: {scan_result}",
-                                    extra={
-                                        "entity_id": entity_id,
-                                        "passport_number": normalized_passport,
-                                        "scan_result": scan_result,
-                                    },
+                                logger.info(
+                                    "Love Bali passport scan completed with result: %s", scan_result,
+                                    extra=scan_extra | {"scan_result": scan_result},
                                 )
                                 data = scan_result.get('data') or {}
                                 message_params.update(
@@ -165,32 +266,24 @@ class IncomingMessageHandler(BaseHandler):
                                 )
                                 success_template = get_message(MessageKey.PASSPORT_FOUND, language=user_lang)
                                 try:
-                                    response_message = success_template.format(**message_params)
+                                    response_message = _template_fn(success_template)(message_params)
                                     isFound = True
                                 except (KeyError, ValueError):
                                     response_message = success_template
 
                             except LoveBaliAPIError as exc:
-                                self.logger.error(
+                                logger.error(
                                     "Love Bali passport scan failed",
-                                    extra={
-                                        "entity_id": entity_id,
-                                        "passport_number": normalized_passport,
-                                        "error": str(exc),
-                                    },
+                                    extra=scan_extra | {"error": str(exc)},
                                     exc_info=True,
                                 )
                                 isError = True
                                 if(exc.status_code == 401 or exc.status_code == 404):
                                     error_message = get_message(MessageKey.PASSPORT_NOT_FOUND, language=user_lang)
                             except Exception as exc:
-                                self.logger.error(
+                                logger.error(
                                     "Unexpected error during Love Bali passport scan",
-                                    extra={
-                                        "entity_id": entity_id,
-                                        "passport_number": normalized_passport,
-                                        "error": str(exc),
-                                    },
+                                    extra=scan_extra | {"error": str(exc)},
                                     exc_info=True,
                                 )
                                 isError = True
@@ -204,14 +297,18 @@ class IncomingMessageHandler(BaseHandler):
                             if response_message:
                                 self.send_message(entity_id=entity_id, message=response_message)
                             
-                            self.logger.debug(f"isFound: {isFound} for sesion: {session}")
+                            logger.debug("isFound: %s for sesion: %s", isFound, session)
                             if session and isFound:
-                                self.logger.debug(f"Updating session to MAIN_MENU for entity_id: {entity_id}")
-                                # Create update request for session
-                                update_request = SessionUpdateRequest(command=Command.MAIN_MENU)
+                                logger.debug("Updating session to MAIN_MENU for entity_id: %s", entity_id)
+                                # The payload is a single trusted enum member,
+                                # so model_construct skips a pointless
+                                # validation cycle
+                                update_request = SessionUpdateRequest.model_construct(
+                                    command=Command.MAIN_MENU
+                                )
                                 
                                 # Update session in Firestore
-                                updated_session = self.firestore_service.update_session(
+                                updated_session = firestore_service.update_session(
                                     session_id=session.session_id,
                                     update_request=update_request
                                 )
@@ -220,27 +317,19 @@ class IncomingMessageHandler(BaseHandler):
                                 
 
 
-                #delete data after processed
-                try:
-                    delete_event = self.delete_realtime_data(event_path)
-                    if delete_event:
-                        self.logger.info(f"Successfully deleted realtime data at path {event_path}")
-                except Exception as e:
-                    self.logger.error(
-                        f"Error deleting realtime data at path {event_path}: {e}",
-                        extra={
-                            'source_path': event_path,
-                            'error': str(e)
-                        },
-                        exc_info=True
-                    )
+                # Delete data after processed, off the event-handling path:
+                # replying to the user does not depend on the delete
+                future = self._cleanup_executor.submit(self.delete_realtime_data, event_path)
+                future.add_done_callback(
+                    lambda f, path=event_path: self._log_cleanup_result(f, path)
+                )
             
             else:
-                self.logger.info("No valid entity_id provided; skipping session lookup")
+                logger.info("No valid entity_id provided; skipping session lookup")
 
         except Exception as e:
-            self.logger.error(
-                f"Error processing incoming lead from path {event_path}: {e}",
+            logger.error(
+                "Error processing incoming lead from path %s: %s", event_path, e,
                 extra={
                     'source_path': event_path,
                     'error': str(e)
@@ -259,15 +348,7 @@ class IncomingMessageHandler(BaseHandler):
             )
             return
 
-        custom_fields = [
-            {
-                "field_id": self.CUSTOM_MESSAGE_FIELD_ID,
-                "field_name": "Custom Message",
-                "field_code": None,
-                "field_type": "textarea",
-                "values": [{"value": message}],
-            }
-        ]
+        custom_fields = [{**_FIELD_TEMPLATE, "values": [{"value": message}]}]
 
         try:
             self.kommo_service.update_lead_custom_fields(entity_id, custom_fields)
@@ -284,24 +365,24 @@ class IncomingMessageHandler(BaseHandler):
 
         
         try:
-            entity_type = self.kommo_service.get_entity_type_code('lead')
+            entity_type = self._lead_entity_type_code()
             salesbot_result = self.kommo_service.launch_salesbot(
-                bot_id=BotID.REPLY_CUSTOM_BOT_ID.value,
+                bot_id=_REPLY_BOT_ID,
                 entity_id=entity_id,
                 entity_type=entity_type,
             )
             self.logger.info(
-                f"Successfully launched salesbot {BotID.REPLY_CUSTOM_BOT_ID.value} for lead {entity_id}",
+                "Successfully launched salesbot %s for lead %s", _REPLY_BOT_ID, entity_id,
                 extra={
                     'entity_id': entity_id,
-                    'bot_id': BotID.REPLY_CUSTOM_BOT_ID.value,
+                    'bot_id': _REPLY_BOT_ID,
                     'salesbot_result': salesbot_result,
                 },
             )
         except Exception as exc:
             self.logger.error(
-                f"Failed to launch salesbot {BotID.REPLY_CUSTOM_BOT_ID.value} for lead {entity_id}: {exc}",
-                extra={"entity_id": entity_id, "bot_id": BotID.REPLY_CUSTOM_BOT_ID.value},
+                "Failed to launch salesbot %s for lead %s: %s", _REPLY_BOT_ID, entity_id, exc,
+                extra={"entity_id": entity_id, "bot_id": _REPLY_BOT_ID},
                 exc_info=True,
             )
     
@@ -314,23 +395,23 @@ class IncomingMessageHandler(BaseHandler):
             )
             return
 
-        main_menu_bot_id = BotID.MAIN_MENU_EN_BOT_ID.value if language == AppLanguage.ENGLISH.value else BotID.MAIN_MENU_ID_BOT_ID.value
+        main_menu_bot_id = _MENU_BOT.get(language, _MENU_BOT_DEFAULT)
 
         try:
-            self.logger.debug(f"Launching main menu bot {main_menu_bot_id} for entity_id: {entity_id}")
-            entity_type = self.kommo_service.get_entity_type_code('lead')
+            self.logger.debug("Launching main menu bot %s for entity_id: %s", main_menu_bot_id, entity_id)
+            entity_type = self._lead_entity_type_code()
             self.kommo_service.launch_salesbot(
                 bot_id=main_menu_bot_id,
                 entity_id=entity_id,
                 entity_type=entity_type,
             )
             self.logger.info(
-                f"Successfully launched main menu bot {main_menu_bot_id} for entity_id: {entity_id}",
+                "Successfully launched main menu bot %s for entity_id: %s", main_menu_bot_id, entity_id,
                 extra={"entity_id": entity_id, "bot_id": main_menu_bot_id},
             )
         except Exception as exc:
             self.logger.error(
-                f"Failed to launch main menu bot {main_menu_bot_id} for entity_id {entity_id}: {exc}",
+                "Failed to launch main menu bot %s for entity_id %s: %s", main_menu_bot_id, entity_id, exc,
                 extra={"entity_id": entity_id, "bot_id": main_menu_bot_id},
                 exc_info=True,
             )
@@ -341,13 +422,17 @@ class IncomingMessageHandler(BaseHandler):
         if not candidate:
             return False
 
-        return bool(self.PASSPORT_ALLOWED_PATTERN.match(candidate))
+        # Equivalent to PASSPORT_ALLOWED_PATTERN (kept above for reference)
+        # for normalized input: normalize_passport_number has already
+        # uppercased, so length + ASCII-alnum covers [A-Z0-9]{6,12} with
+        # three C-level checks instead of a regex-engine call per message
+        return 6 <= len(candidate) <= 12 and candidate.isalnum() and candidate.isascii()
 
     def normalize_passport_number(self, user_message: str) -> str | None:
         """Normalize passport input by stripping whitespace and separators."""
         if not user_message:
             return None
 
-        normalized = user_message.strip().upper().replace(" ", "").replace("-", "")
+        normalized = user_message.translate(_PASSPORT_TRANS).strip()
         return normalized or None
 
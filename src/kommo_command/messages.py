@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Dict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping
 
 from .types import AppLanguage
 
@@ -20,6 +22,14 @@ class MessageKey(str, Enum):
 
 DEFAULT_LANGUAGE = AppLanguage.ENGLISH
 
+# Uppercase code -> enum member index, including the member names as aliases
+# ("ENGLISH"/"INDONESIAN"), so normalization is one dict lookup instead of an
+# enum construction attempt inside a try/except
+_LANG_INDEX: Dict[str, AppLanguage] = {
+    **{lang.value.upper(): lang for lang in AppLanguage},
+    **{lang.name: lang for lang in AppLanguage},
+}
+
 # Registry of localized messages keyed by message identifier then language.
 _MESSAGES: Dict[MessageKey, Dict[AppLanguage, str]] = {
     MessageKey.PASSPORT_PROMPT: {
@@ -57,29 +67,40 @@ _MESSAGES: Dict[MessageKey, Dict[AppLanguage, str]] = {
 }
 
 
+@lru_cache(maxsize=32)
+def _normalize_language_str(language: str) -> AppLanguage:
+    """Memoized strip/upper/lookup for string language codes."""
+    return _LANG_INDEX.get(language.strip().upper(), DEFAULT_LANGUAGE)
+
+
 def _normalize_language(language: AppLanguage | str | None) -> AppLanguage:
-    """Normalize incoming language inputs to a known AppLanguage value."""
+    """Normalize incoming language inputs to a known AppLanguage value.
+
+    Stays uncached so arbitrary (possibly unhashable) event-supplied values
+    fall through to the default language instead of blowing up as a cache
+    key; only the str branch is worth memoizing anyway.
+    """
     if isinstance(language, AppLanguage):
         return language
 
     if isinstance(language, str):
-        cleaned = language.strip().upper()
-        try:
-            return AppLanguage(cleaned)
-        except ValueError:
-            pass
+        return _normalize_language_str(language)
 
     return DEFAULT_LANGUAGE
 
 
-def get_message(key: MessageKey, language: AppLanguage | str | None = None) -> str:
-    """Return the localized message for the given key, falling back to default language."""
+@lru_cache(maxsize=64)
+def _get_message_cached(key: MessageKey, language: AppLanguage) -> str:
+    """Resolve a message for already-normalized arguments, memoized.
+
+    The catalog is static and the (key, language) space is tiny, so repeat
+    lookups collapse to one cache hit instead of the dict walks below.
+    """
     by_language = _MESSAGES.get(key)
     if by_language is None:
         raise KeyError(f"No message configured for key: {key}")
 
-    normalized_language = _normalize_language(language)
-    message = by_language.get(normalized_language)
+    message = by_language.get(language)
     if message is not None:
         return message
 
@@ -91,6 +112,18 @@ def get_message(key: MessageKey, language: AppLanguage | str | None = None) -> s
     return next(iter(by_language.values()))
 
 
-def get_message_catalog() -> Dict[MessageKey, Dict[AppLanguage, str]]:
-    """Return a shallow copy of the message catalog for read-only operations."""
-    return {key: dict(value) for key, value in _MESSAGES.items()}
+def get_message(key: MessageKey, language: AppLanguage | str | None = None) -> str:
+    """Return the localized message for the given key, falling back to default language."""
+    return _get_message_cached(key, _normalize_language(language))
+
+
+# Read-only view over the catalog, built once; returning it costs nothing
+# and still protects _MESSAGES from mutation by callers
+_MESSAGES_READONLY: Mapping[MessageKey, Mapping[AppLanguage, str]] = MappingProxyType(
+    {key: MappingProxyType(value) for key, value in _MESSAGES.items()}
+)
+
+
+def get_message_catalog() -> Mapping[MessageKey, Mapping[AppLanguage, str]]:
+    """Return a read-only view of the message catalog."""
+    return _MESSAGES_READONLY
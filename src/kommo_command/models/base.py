@@ -3,16 +3,15 @@
 from __future__ import annotations
 
 from typing import Any, Dict
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class BaseFirestoreModel(BaseModel):
     """Base model for Firestore document models with common serialization methods."""
-    
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {}
-        
+
+    model_config = ConfigDict()
+
+
     def to_firestore_dict(self) -> Dict[str, Any]:
         """Convert the model to a Firestore-compatible dictionary."""
         return self.model_dump()
@@ -6,32 +6,57 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
+from pydantic import Field, model_validator
+
 from .base import BaseFirestoreModel
 
 
 class LeadModel(BaseFirestoreModel):
     """Model for storing lead information in Firestore."""
-    
-    lead_id: str
+
+    lead_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     source_path: str  # Original Firebase path where the lead came from
     data: Dict[str, Any]  # The actual lead data
     created_at: datetime
     updated_at: datetime
     processed: bool = False
     metadata: Dict[str, Any] = {}
-    
-    def __init__(self, **data):
-        if 'lead_id' not in data:
-            data['lead_id'] = str(uuid.uuid4())
-        
-        if 'created_at' not in data:
-            data['created_at'] = datetime.now(timezone.utc)
-        
-        if 'updated_at' not in data:
-            data['updated_at'] = datetime.now(timezone.utc)
-            
-        super().__init__(**data)
-    
+
+    @model_validator(mode='before')
+    @classmethod
+    def _default_timestamps(cls, values: Any) -> Any:
+        """Fill missing timestamps from a single clock read.
+
+        Replaces the former Python-level __init__ (which kept pydantic-core
+        from owning construction) while keeping created_at and updated_at
+        identical on a fresh lead.
+        """
+        if isinstance(values, dict) and (
+            'created_at' not in values or 'updated_at' not in values
+        ):
+            values = {**values}
+            now = datetime.now(timezone.utc)
+            values.setdefault('created_at', now)
+            values.setdefault('updated_at', now)
+        return values
+
+    def to_firestore_dict(self) -> Dict[str, Any]:
+        """Convert the model to a Firestore-compatible dictionary.
+
+        Built directly from the fields instead of pydantic's generic
+        model_dump walk; this runs once per handled event and the field set
+        is fixed.
+        """
+        return {
+            'lead_id': self.lead_id,
+            'source_path': self.source_path,
+            'data': self.data,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'processed': self.processed,
+            'metadata': self.metadata,
+        }
+
     def update_timestamp(self) -> None:
         """Update the updated_at timestamp."""
         self.updated_at = datetime.now(timezone.utc)
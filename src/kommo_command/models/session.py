@@ -24,28 +24,30 @@ class SessionModel(BaseFirestoreModel):
     expires_at: Optional[datetime] = Field(default=None, description="Session expiration timestamp")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional session metadata")
     is_active: bool = Field(default=True, description="Whether the session is active")
-    
-    class Config(BaseFirestoreModel.Config):
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
-        
+
+    # Configuration is inherited from BaseFirestoreModel; pydantic v2 already
+    # serializes datetimes to ISO strings in JSON mode, so the old
+    # json_encoders override is no longer needed.
+
     def to_firestore_dict(self) -> Dict[str, Any]:
-        """Convert the model to a Firestore-compatible dictionary."""
-        data = self.model_dump()
-        
-        # Convert datetime objects to Firestore timestamps
-        for field_name in ['created_at', 'updated_at', 'expires_at']:
-            if data.get(field_name):
-                # Firestore expects datetime objects, not ISO strings
-                data[field_name] = data[field_name]
-        
-        # Convert Command enum to its value
-        if isinstance(data.get('command'), Command):
-            data['command'] = data['command'].value
-        
-        return data
+        """Convert the model to a Firestore-compatible dictionary.
+
+        Built directly from the fields instead of pydantic's generic
+        model_dump walk, mirroring LeadModel; the field set is fixed and
+        Firestore takes datetime objects as-is.
+        """
+        command = self.command
+        return {
+            'session_id': self.session_id,
+            'entity_id': self.entity_id,
+            'language': self.language,
+            'command': command.value if command is not None else None,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'expires_at': self.expires_at,
+            'metadata': self.metadata,
+            'is_active': self.is_active,
+        }
     
     @classmethod
     def from_firestore_dict(cls, data: Dict[str, Any]) -> SessionModel:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from .config import Settings
 from .services import (
     KommoAPIService,
@@ -10,7 +12,13 @@ from .services import (
     LoveBaliAPIService,
 )
 
+# Settings is frozen (hashable), so each factory can memoize per settings
+# object: these clients carry HTTP connection pools, auth token caches and
+# gRPC channels that are expensive to rebuild, and one instance per config
+# is the intended usage.
+
 
+@lru_cache(maxsize=None)
 def create_kommo_service(settings: Settings) -> KommoAPIService:
     """
     Create a Kommo API service instance from settings.
@@ -29,6 +37,7 @@ def create_kommo_service(settings: Settings) -> KommoAPIService:
     )
 
 
+@lru_cache(maxsize=None)
 def create_firestore_service(settings: Settings) -> FirestoreService:
     """
     Create a Firestore service instance from settings.
@@ -46,6 +55,7 @@ def create_firestore_service(settings: Settings) -> FirestoreService:
     )
 
 
+@lru_cache(maxsize=None)
 def create_firebase_listener(settings: Settings) -> FirebaseAdminListener:
     """
     Create a Firebase Admin listener instance from settings.
@@ -63,6 +73,7 @@ def create_firebase_listener(settings: Settings) -> FirebaseAdminListener:
     )
 
 
+@lru_cache(maxsize=None)
 def create_love_bali_service(settings: Settings) -> LoveBaliAPIService:
     """
     Create a Love Bali API service instance from settings.
@@ -156,15 +156,8 @@ class FirebaseAdminListener:
                 data=event.data
             )
             
-            # Log event data to console
-            print(f"\n🔥 Firebase Event Detected:")
-            print(f"   Event Type: {firebase_event.event}")
-            print(f"   Path: {firebase_event.path}")
-            print(f"   Data: {firebase_event.data}")
-            print("-" * 50)
-            
-            logger.info(f"Firebase event: {firebase_event.event} at {firebase_event.path}")
-            logger.debug(f"Event data: {firebase_event.data}")
+            logger.info("Firebase event: %s at %s", firebase_event.event, firebase_event.path)
+            logger.debug("Event data: %s", firebase_event.data)
             
             try:
                 callback(firebase_event)
@@ -203,13 +196,13 @@ class FirebaseAdminListener:
                     if events_queue:
                         event = events_queue.pop(0)
                         
-                        # Log event data to console
-                        print(f"\n🔥 Firebase Event (Generator):")
-                        print(f"   Event Type: {event.event}")
-                        print(f"   Path: {event.path}")
-                        print(f"   Data: {event.data}")
-                        print("-" * 50)
-                        
+                        logger.debug(
+                            "Firebase event (generator): %s at %s with data: %s",
+                            event.event,
+                            event.path,
+                            event.data,
+                        )
+
                         yield event
                 
                 # Short sleep to prevent busy waiting
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from itertools import compress
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 import firebase_admin
+from google.api_core.exceptions import NotFound
 from firebase_admin import credentials
 from google.cloud import firestore
 from google.cloud.firestore import FieldFilter
@@ -15,10 +19,89 @@ from ..models import SessionModel, SessionCreateRequest, SessionUpdateRequest
 
 logger = logging.getLogger(__name__)
 
+# Bound once: every timestamp in this module reads the same tzinfo, so skip
+# the repeated module-attribute lookups on the hot session paths
+_UTC = timezone.utc
+
+# Firestore clients shared process-wide, keyed by (project, database,
+# service-account path). Each client owns a gRPC channel/connection pool
+# whose warm-up is paid once per key instead of once per FirestoreService.
+_CLIENT_CACHE: Dict[tuple, firestore.Client] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _tune_grpc_keepalive(client: firestore.Client) -> None:
+    """Build the client's gRPC transport with explicit keepalive options.
+
+    The library's lazy transport setup only sets grpc.keepalive_time_ms;
+    without a keepalive timeout and with pings capped on idle channels, a
+    NAT or load balancer can silently drop the connection between event
+    bursts and the next RPC eats a reconnect. Pre-building the channel here
+    mirrors the library's own _firestore_api_helper, so any failure simply
+    leaves the default lazy path in place.
+    """
+    try:
+        from google.cloud.firestore_v1.services.firestore import (
+            client as firestore_client_module,
+        )
+        from google.cloud.firestore_v1.services.firestore.transports.grpc import (
+            FirestoreGrpcTransport,
+        )
+
+        if client._firestore_api_internal is not None or client._emulator_host is not None:
+            return
+
+        channel = FirestoreGrpcTransport.create_channel(
+            client._target,
+            credentials=client._credentials,
+            options=[
+                ('grpc.keepalive_time_ms', 30000),
+                ('grpc.keepalive_timeout_ms', 10000),
+                ('grpc.http2.max_pings_without_data', 0),
+            ],
+        )
+        transport = FirestoreGrpcTransport(host=client._target, channel=channel)
+        client._transport = transport
+        client._firestore_api_internal = firestore_client_module.FirestoreClient(
+            transport=transport,
+            client_options=client._client_options,
+            client_info=client._client_info,
+        )
+        logger.debug("Configured Firestore gRPC channel with keepalive options")
+    except Exception as e:
+        logger.debug(f"Could not tune gRPC keepalive; using default transport: {e}")
+
+
+def shutdown_all_clients() -> None:
+    """Close every shared Firestore client; call only at process shutdown."""
+    with _CLIENT_CACHE_LOCK:
+        clients = list(_CLIENT_CACHE.values())
+        _CLIENT_CACHE.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception as e:
+            logger.debug(f"Error closing shared Firestore client: {e}")
+
 
 class FirestoreService:
-    """Service class for Firestore database operations."""
-    
+    """Service class for Firestore database operations.
+
+    A single ``firestore.Client`` (with its gRPC channel and connection pool)
+    is created at initialization and reused for every collection and every
+    handler; collection references are cheap views onto that shared client.
+    """
+
+    # WriteBatch hard limit is 500 ops; flush a little below it
+    BUFFERED_WRITE_LIMIT = 400
+    BUFFERED_FLUSH_INTERVAL = 0.25
+
+    # Short-lived read cache for get_session: long enough to collapse the
+    # repeated reads of one event burst, short enough that external writers
+    # are picked up quickly
+    SESSION_CACHE_TTL = 5.0
+    SESSION_CACHE_MAX = 1024
+
     def __init__(
         self,
         project_id: str,
@@ -28,7 +111,7 @@ class FirestoreService:
     ) -> None:
         """
         Initialize Firestore service.
-        
+
         Args:
             project_id: Firebase project ID
             database_name: Firestore database name (from environment config)
@@ -41,23 +124,43 @@ class FirestoreService:
         self.app_name = app_name or f"firestore_service_{id(self)}"
         self._app: Optional[firebase_admin.App] = None
         self._db: Optional[firestore.Client] = None
-        
+
+        # Buffered-write state: pending WriteBatch, op counter, and a timer
+        # that flushes shortly after the first buffered write of a burst
+        self._batch_lock = threading.Lock()
+        self._pending_batch: Optional[Any] = None
+        self._pending_count = 0
+        self._flush_timer: Optional[threading.Timer] = None
+
+        # session_id -> (monotonic expiry, SessionModel); mutations in this
+        # service write through or invalidate, so within-process readers see
+        # their own writes
+        self._session_cache: Dict[str, tuple[float, SessionModel]] = {}
+        self._session_cache_lock = threading.Lock()
+
         self._initialize_app()
     
     def _initialize_app(self) -> None:
         """Initialize Firebase Admin SDK app for Firestore."""
         try:
-            # Check if app already exists and delete it
+            # Reuse an existing Firebase app with this name when it already
+            # points at the same project; tearing it down just to rebuild an
+            # identical one severs its connections for nothing. Only delete
+            # when the configuration actually differs.
+            existing_app: Optional[firebase_admin.App] = None
             try:
                 existing_app = firebase_admin.get_app(self.app_name)
-                firebase_admin.delete_app(existing_app)
-                logger.debug(f"Deleted existing Firebase app: {self.app_name}")
+                if existing_app.project_id != self.project_id:
+                    firebase_admin.delete_app(existing_app)
+                    logger.debug(f"Deleted stale Firebase app: {self.app_name}")
+                    existing_app = None
             except ValueError:
                 pass  # App doesn't exist, which is fine
             
             # Initialize credentials first
             if self.service_account_path:
-                cred = credentials.Certificate(self.service_account_path)
+                if existing_app is None:
+                    cred = credentials.Certificate(self.service_account_path)
                 # For Google Cloud client, we need to use the service account file directly
                 from google.oauth2 import service_account
                 gc_credentials = service_account.Credentials.from_service_account_file(  # type: ignore
@@ -65,35 +168,49 @@ class FirestoreService:
                 )
             else:
                 # Use Application Default Credentials
-                cred = credentials.ApplicationDefault()
+                if existing_app is None:
+                    cred = credentials.ApplicationDefault()
                 gc_credentials = None  # Let it use ADC
             
-            self._app = firebase_admin.initialize_app(
-                cred,
-                {
-                    'projectId': self.project_id,
-                },
-                name=self.app_name
-            )
-            
-            # Initialize Firestore client using Google Cloud library directly
-            # This allows us to specify a named database
-            if self.database_name and self.database_name != "(default)":
-                # Use named database with Google Cloud Firestore client
-                logger.info(f"Initializing Firestore client for named database: {self.database_name}")
-                self._db = firestore.Client(
-                    project=self.project_id,
-                    database=self.database_name,
-                    credentials=gc_credentials
-                )
+            if existing_app is not None:
+                logger.debug(f"Reusing existing Firebase app: {self.app_name}")
+                self._app = existing_app
             else:
-                # Use default database
-                logger.info("Initializing Firestore client for default database")
-                self._db = firestore.Client(
-                    project=self.project_id,
-                    credentials=gc_credentials
+                self._app = firebase_admin.initialize_app(
+                    cred,
+                    {
+                        'projectId': self.project_id,
+                    },
+                    name=self.app_name
                 )
             
+            # Initialize Firestore client using Google Cloud library directly
+            # (this allows us to specify a named database), reusing the
+            # process-wide client for this configuration when one exists
+            client_key = (self.project_id, self.database_name, self.service_account_path)
+            with _CLIENT_CACHE_LOCK:
+                self._db = _CLIENT_CACHE.get(client_key)
+                if self._db is None:
+                    if self.database_name and self.database_name != "(default)":
+                        # Use named database with Google Cloud Firestore client
+                        logger.info(f"Initializing Firestore client for named database: {self.database_name}")
+                        self._db = firestore.Client(
+                            project=self.project_id,
+                            database=self.database_name,
+                            credentials=gc_credentials
+                        )
+                    else:
+                        # Use default database
+                        logger.info("Initializing Firestore client for default database")
+                        self._db = firestore.Client(
+                            project=self.project_id,
+                            credentials=gc_credentials
+                        )
+                    _tune_grpc_keepalive(self._db)
+                    _CLIENT_CACHE[client_key] = self._db
+                else:
+                    logger.debug(f"Reusing shared Firestore client for database: {self.database_name}")
+            
             logger.info(f"Initialized Firestore client for database: {self.database_name}")
             
             logger.info(f"Initialized Firestore service for project: {self.project_id}")
@@ -111,26 +228,9 @@ class FirestoreService:
             return False
             
         try:
-            # Try to write and read a test document
-            test_doc_ref = self._db.collection('_connection_test').document('test')
-            test_data = {
-                'timestamp': datetime.now(timezone.utc),
-                'message': 'Connection test successful'
-            }
-            
-            # Write test data
-            test_doc_ref.set(test_data)
-            logger.info("Firestore write test successful")
-            
-            # Read test data
-            doc = test_doc_ref.get()
-            if doc.exists:
-                logger.info("Firestore read test successful")
-            
-            # Clean up test data
-            test_doc_ref.delete()
-            logger.info("Test data cleaned up")
-            
+            # A single bounded read replaces the old set/get/delete probe:
+            # one RPC, no billable writes, and no test documents left behind
+            self._db.collection('sessions').limit(1).get(timeout=5.0)
             logger.info("Firestore connection test successful")
             return True
             
@@ -160,6 +260,7 @@ class FirestoreService:
             session_ref = self._db.collection('sessions').document(session.session_id)
             session_ref.set(session.to_firestore_dict())
             
+            self.cache_session(session)
             logger.info(f"Created session: {session.session_id}")
             return session
             
@@ -167,6 +268,32 @@ class FirestoreService:
             logger.error(f"Failed to create session: {e}")
             raise
     
+    def cache_session(self, session: SessionModel) -> None:
+        """Write a session into the read cache, sweeping expired entries.
+
+        Public so callers that persist sessions outside this service's own
+        write paths (e.g. deferred batch writes) can keep the cache warm.
+        The cache stores its own deep copy, so later mutations of the
+        caller's model never leak into cached reads.
+        """
+        now = time.monotonic()
+        with self._session_cache_lock:
+            if len(self._session_cache) >= self.SESSION_CACHE_MAX:
+                self._session_cache = {
+                    sid: entry
+                    for sid, entry in self._session_cache.items()
+                    if entry[0] > now
+                }
+            self._session_cache[session.session_id] = (
+                now + self.SESSION_CACHE_TTL,
+                session.model_copy(deep=True),
+            )
+
+    def _uncache_session(self, session_id: str) -> None:
+        """Drop a session from the read cache, if present."""
+        with self._session_cache_lock:
+            self._session_cache.pop(session_id, None)
+
     def get_session(self, session_id: str) -> Optional[SessionModel]:
         """
         Get a session by ID.
@@ -180,7 +307,17 @@ class FirestoreService:
         if not self._db:
             logger.error("Firestore client not initialized")
             return None
-            
+
+        with self._session_cache_lock:
+            entry = self._session_cache.get(session_id)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    logger.debug(f"Session served from cache: {session_id}")
+                    # Hand back a copy: concurrent callers must not alias
+                    # (and mutate) the cached instance
+                    return entry[1].model_copy(deep=True)
+                del self._session_cache[session_id]
+
         try:
             session_ref = self._db.collection('sessions').document(session_id)
             doc = session_ref.get()
@@ -195,6 +332,7 @@ class FirestoreService:
                 return None
                 
             session = SessionModel.from_firestore_dict(data)
+            self.cache_session(session)
             logger.debug(f"Retrieved session: {session_id}")
             return session
             
@@ -219,50 +357,60 @@ class FirestoreService:
             
         try:
             session_ref = self._db.collection('sessions').document(session_id)
-            doc = session_ref.get()
-            
-            if not doc.exists:
-                logger.debug(f"Session not found for update: {session_id}")
-                return None
-            
-            data = doc.to_dict()
-            if not data:
-                logger.debug(f"Session document is empty: {session_id}")
-                return None
-            
-            # Get current session
-            session = SessionModel.from_firestore_dict(data)
-            
-            # Apply updates
-            update_data: Dict[str, Any] = {}
+
+            # Build the update without reading the document first; update()
+            # carries an implicit exists precondition and raises NotFound for
+            # missing docs, and dotted metadata paths merge into the existing
+            # map server-side. SERVER_TIMESTAMP lets Firestore stamp
+            # updated_at, so clock skew between workers cannot reorder the
+            # order_by('updated_at') queries
+            now = datetime.now(_UTC)
+            update_data: Dict[str, Any] = {'updated_at': firestore.SERVER_TIMESTAMP}
             if update_request.language is not None:
-                session.language = update_request.language
                 update_data['language'] = update_request.language
-            
+
             if update_request.metadata is not None:
-                session.metadata.update(update_request.metadata)
-                update_data['metadata'] = session.metadata
-            
+                for meta_key, meta_value in update_request.metadata.items():
+                    update_data[f'metadata.{meta_key}'] = meta_value
+
             if update_request.is_active is not None:
-                session.is_active = update_request.is_active
                 update_data['is_active'] = update_request.is_active
-            
+
             if update_request.expires_in_hours is not None:
                 from datetime import timedelta
-                session.expires_at = datetime.now(timezone.utc) + timedelta(hours=update_request.expires_in_hours)
-                update_data['expires_at'] = session.expires_at
-            
+                update_data['expires_at'] = now + timedelta(hours=update_request.expires_in_hours)
+
             if update_request.command is not None:
-                session.command = update_request.command
-                update_data['command'] = session.command.value if session.command else None
-            
-            # Update timestamp
-            session.update_timestamp()
-            update_data['updated_at'] = session.updated_at
-            
-            # Save to Firestore
-            session_ref.update(update_data)
-            
+                update_data['command'] = update_request.command.value
+
+            try:
+                session_ref.update(update_data)
+            except NotFound:
+                logger.debug(f"Session not found for update: {session_id}")
+                return None
+
+            # Return the updated model from the read cache when fresh (no
+            # extra RPC); otherwise re-read, which also repopulates the cache
+            with self._session_cache_lock:
+                entry = self._session_cache.pop(session_id, None)
+            session = entry[1] if entry is not None and entry[0] > time.monotonic() else None
+            if session is not None:
+                if update_request.language is not None:
+                    session.language = update_request.language
+                if update_request.metadata is not None:
+                    session.metadata.update(update_request.metadata)
+                if update_request.is_active is not None:
+                    session.is_active = update_request.is_active
+                if 'expires_at' in update_data:
+                    session.expires_at = update_data['expires_at']
+                if update_request.command is not None:
+                    session.command = update_request.command
+                # Close local approximation of the server-stamped value
+                session.updated_at = now
+                self.cache_session(session)
+            else:
+                session = self.get_session(session_id)
+
             logger.info(f"Updated session: {session_id}")
             return session
             
@@ -286,13 +434,15 @@ class FirestoreService:
             
         try:
             session_ref = self._db.collection('sessions').document(session_id)
-            doc = session_ref.get()
-            
-            if not doc.exists:
+            try:
+                # Exists precondition replaces the former pre-read get():
+                # one RPC, NotFound signals the missing-doc case
+                session_ref.delete(option=self._db.write_option(exists=True))
+            except NotFound:
                 logger.debug(f"Session not found for deletion: {session_id}")
                 return False
-            
-            session_ref.delete()
+
+            self._uncache_session(session_id)
             logger.info(f"Deleted session: {session_id}")
             return True
             
@@ -300,6 +450,61 @@ class FirestoreService:
             logger.error(f"Failed to delete session {session_id}: {e}")
             raise
     
+    def _deactivate_sessions_batch(self, session_ids: List[str], now: datetime) -> None:
+        """
+        Deactivate several sessions in one WriteBatch commit.
+
+        Replaces per-session update_session calls (a get + update round-trip
+        each) on the expiry fan-out paths with a single RPC.
+
+        Args:
+            session_ids: IDs of the sessions to deactivate
+            now: Timestamp to record as updated_at
+        """
+        if not session_ids or not self._db:
+            return
+
+        try:
+            batch = self._db.batch()
+            sessions = self._db.collection('sessions')
+            for session_id in session_ids:
+                batch.update(sessions.document(session_id), {'is_active': False, 'updated_at': now})
+            batch.commit()
+            for session_id in session_ids:
+                self._uncache_session(session_id)
+            logger.debug(f"Deactivated {len(session_ids)} expired session(s) in one batch")
+        except Exception as e:
+            logger.error(f"Failed to batch-deactivate {len(session_ids)} session(s): {e}")
+
+    def _stream_active_session_docs(self, query: Any) -> Any:
+        """
+        Stream session docs with a server-side expiry filter when possible.
+
+        Adds expires_at > now so expired rows never leave the server. The
+        range filter also drops sessions with no expires_at field, which
+        is_expired() treats as never expiring, so a second equality query
+        fetches those and the results are merged. The range filter needs a
+        composite index; on a missing-index error this falls back to
+        streaming the unfiltered query. Callers keep their client-side
+        is_expired() check either way.
+        """
+        filtered = query.where(
+            filter=FieldFilter('expires_at', '>', datetime.now(_UTC))
+        )
+        never_expiring = query.where(filter=FieldFilter('expires_at', '==', None))
+        try:
+            docs = list(filtered.stream())
+            docs.extend(never_expiring.stream())
+            return docs
+        except Exception as index_error:
+            if "requires an index" in str(index_error):
+                logger.warning(
+                    "Composite index required for server-side session expiry filter; "
+                    "falling back to client-side filtering"
+                )
+                return query.stream()
+            raise
+
     def get_sessions_by_user(self, user_id: str, active_only: bool = True) -> List[SessionModel]:
         """
         Get all sessions for a user.
@@ -320,21 +525,25 @@ class FirestoreService:
             
             if active_only:
                 query = query.where(filter=FieldFilter('is_active', '==', True))
-            
-            docs = query.stream()
-            sessions = []
-            
-            for doc in docs:
-                data = doc.to_dict()
-                if data:
-                    session = SessionModel.from_firestore_dict(data)
-                    # Check if session is expired
-                    if not session.is_expired():
-                        sessions.append(session)
-                    elif session.is_active:
-                        # Auto-deactivate expired sessions
-                        self.update_session(session.session_id, SessionUpdateRequest(is_active=False))
-            
+                docs = self._stream_active_session_docs(query)
+            else:
+                docs = query.stream()
+            # Decode in bulk, then split live from expired in one pass over
+            # a shared expiry mask (is_expired reads the clock, so evaluate
+            # it once per session)
+            raw = [data for doc in docs if (data := doc.to_dict())]
+            decoded = list(map(SessionModel.from_firestore_dict, raw))
+            expired = [session.is_expired() for session in decoded]
+            sessions = list(compress(decoded, (not flag for flag in expired)))
+            # Expired-but-active rows are auto-deactivated in one batch below
+            to_deactivate = [
+                session.session_id
+                for session, flag in zip(decoded, expired)
+                if flag and session.is_active
+            ]
+
+            self._deactivate_sessions_batch(to_deactivate, datetime.now(_UTC))
+
             logger.debug(f"Retrieved {len(sessions)} sessions for user: {user_id}")
             return sessions
             
@@ -362,21 +571,25 @@ class FirestoreService:
             
             if active_only:
                 query = query.where(filter=FieldFilter('is_active', '==', True))
-            
-            docs = query.stream()
-            sessions = []
-            
-            for doc in docs:
-                data = doc.to_dict()
-                if data:
-                    session = SessionModel.from_firestore_dict(data)
-                    # Check if session is expired
-                    if not session.is_expired():
-                        sessions.append(session)
-                    elif session.is_active:
-                        # Auto-deactivate expired sessions
-                        self.update_session(session.session_id, SessionUpdateRequest(is_active=False))
-            
+                docs = self._stream_active_session_docs(query)
+            else:
+                docs = query.stream()
+            # Decode in bulk, then split live from expired in one pass over
+            # a shared expiry mask (is_expired reads the clock, so evaluate
+            # it once per session)
+            raw = [data for doc in docs if (data := doc.to_dict())]
+            decoded = list(map(SessionModel.from_firestore_dict, raw))
+            expired = [session.is_expired() for session in decoded]
+            sessions = list(compress(decoded, (not flag for flag in expired)))
+            # Expired-but-active rows are auto-deactivated in one batch below
+            to_deactivate = [
+                session.session_id
+                for session, flag in zip(decoded, expired)
+                if flag and session.is_active
+            ]
+
+            self._deactivate_sessions_batch(to_deactivate, datetime.now(_UTC))
+
             logger.debug(f"Retrieved {len(sessions)} sessions for entity: {entity_id}")
             return sessions
             
@@ -487,11 +700,47 @@ class FirestoreService:
             Latest SessionModel if found, None otherwise
         """
         try:
+            # Let the server pick the newest doc off its index instead of
+            # streaming every session and taking max() here
+            if self._db:
+                query = self._db.collection('sessions').where(filter=FieldFilter('entity_id', '==', entity_id))
+                if active_only:
+                    query = query.where(filter=FieldFilter('is_active', '==', True))
+                query = query.order_by('updated_at', direction=firestore.Query.DESCENDING).limit(1)
+                try:
+                    for doc in query.stream():
+                        data = doc.to_dict()
+                        if data:
+                            latest_session = SessionModel.from_firestore_dict(data)
+                            # Match the fallback scan: expired sessions are
+                            # never handed back, and expired-but-active ones
+                            # get swept
+                            if latest_session.is_expired():
+                                if latest_session.is_active:
+                                    self._deactivate_sessions_batch(
+                                        [latest_session.session_id], datetime.now(_UTC)
+                                    )
+                                logger.debug(
+                                    f"Latest session for entity {entity_id} is expired: "
+                                    f"{latest_session.session_id}"
+                                )
+                                return None
+                            logger.debug(f"Retrieved latest session for entity {entity_id}: {latest_session.session_id}")
+                            return latest_session
+                    return None
+                except Exception as index_error:
+                    if "requires an index" not in str(index_error):
+                        raise
+                    logger.warning(
+                        "Composite index required for latest-session query; "
+                        "falling back to client-side scan"
+                    )
+
+            # Fallback: stream all matching sessions and pick the newest
             sessions = self.get_sessions_by_entity_id(entity_id, active_only)
             if not sessions:
                 return None
-            
-            # Sort by updated_at descending to get the latest session
+
             latest_session = max(sessions, key=lambda s: s.updated_at)
             logger.debug(f"Retrieved latest session for entity {entity_id}: {latest_session.session_id}")
             return latest_session
@@ -500,10 +749,13 @@ class FirestoreService:
             logger.error(f"Failed to get latest session for entity {entity_id}: {e}")
             raise
     
+    # Stay safely under the 500-op WriteBatch hard limit per cleanup page
+    CLEANUP_PAGE_SIZE = 450
+
     def cleanup_expired_sessions(self) -> int:
         """
-        Clean up expired sessions.
-        
+        Clean up expired sessions, one page and one batch commit at a time.
+
         Returns:
             Number of sessions cleaned up
         """
@@ -512,23 +764,58 @@ class FirestoreService:
             return 0
             
         try:
-            current_time = datetime.now(timezone.utc)
+            current_time = datetime.now(_UTC)
             
             # Query for expired sessions - this may require a composite index
             try:
                 # Use separate where clauses instead of And filter for better compatibility
-                query = self._db.collection('sessions').where(filter=FieldFilter('expires_at', '<=', current_time)).where(filter=FieldFilter('is_active', '==', True))
-                
-                docs = query.stream()
+                base_query = (
+                    self._db.collection('sessions')
+                    .where(filter=FieldFilter('expires_at', '<=', current_time))
+                    .where(filter=FieldFilter('is_active', '==', True))
+                    .order_by('expires_at')
+                    .limit(self.CLEANUP_PAGE_SIZE)
+                )
+
                 cleaned_count = 0
-                
-                batch = self._db.batch()
-                for doc in docs:
-                    batch.update(doc.reference, {'is_active': False, 'updated_at': current_time})
-                    cleaned_count += 1
-                
+                cursor = None
+
+                # Deactivations are independent single-doc updates, so a
+                # BulkWriter (parallel, self-throttling, no atomicity) beats
+                # one serial batch commit per page. Older client versions
+                # without bulk_writer() fall back to the per-page batch.
+                bulk_writer = (
+                    self._db.bulk_writer() if hasattr(self._db, 'bulk_writer') else None
+                )
+                update_data = {'is_active': False, 'updated_at': current_time}
+
+                # Page through the expired set so each WriteBatch stays under
+                # the 500-op limit no matter how large the backlog is
+                while True:
+                    query = base_query if cursor is None else base_query.start_after(cursor)
+                    docs = list(query.stream())
+                    if not docs:
+                        break
+
+                    if bulk_writer is not None:
+                        for doc in docs:
+                            bulk_writer.update(doc.reference, update_data)
+                    else:
+                        batch = self._db.batch()
+                        for doc in docs:
+                            batch.update(doc.reference, update_data)
+                        batch.commit()
+                    cleaned_count += len(docs)
+
+                    if len(docs) < self.CLEANUP_PAGE_SIZE:
+                        break
+                    cursor = docs[-1]
+
+                if bulk_writer is not None:
+                    # Flushes all queued writes and waits for completion
+                    bulk_writer.close()
+
                 if cleaned_count > 0:
-                    batch.commit()
                     logger.info(f"Cleaned up {cleaned_count} expired sessions")
                 
                 return cleaned_count
@@ -545,14 +832,113 @@ class FirestoreService:
             logger.error(f"Failed to cleanup expired sessions: {e}")
             raise
     
+    def buffered_set(self, collection_name: str, document_id: str, data: Dict[str, Any]) -> None:
+        """
+        Queue a document write into a shared WriteBatch instead of issuing
+        one RPC per document.
+
+        The batch is committed when it reaches BUFFERED_WRITE_LIMIT ops or
+        when the flush timer fires, whichever comes first. Call flush() to
+        force any pending writes out (e.g. on shutdown).
+
+        Args:
+            collection_name: Firestore collection name
+            document_id: Document ID
+            data: Data to write
+        """
+        if not self._db:
+            raise RuntimeError("Firestore client not initialized")
+
+        with self._batch_lock:
+            if self._pending_batch is None:
+                self._pending_batch = self._db.batch()
+                self._flush_timer = threading.Timer(self.BUFFERED_FLUSH_INTERVAL, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+            doc_ref = self._db.collection(collection_name).document(document_id)
+            self._pending_batch.set(doc_ref, data)
+            self._pending_count += 1
+            should_flush = self._pending_count >= self.BUFFERED_WRITE_LIMIT
+
+        if should_flush:
+            self.flush()
+
+    def batch_write(self, operations: List[tuple[str, str, Dict[str, Any]]]) -> bool:
+        """
+        Commit several document sets in a single WriteBatch (one RPC).
+
+        Args:
+            operations: (collection_name, document_id, data) tuples
+
+        Returns:
+            True if the batch committed successfully
+        """
+        if not self._db:
+            raise RuntimeError("Firestore client not initialized")
+
+        if not operations:
+            return True
+
+        try:
+            batch = self._db.batch()
+            for collection_name, document_id, data in operations:
+                batch.set(self._db.collection(collection_name).document(document_id), data)
+            batch.commit()
+            logger.debug(f"Committed batch of {len(operations)} write(s)")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to commit batch of {len(operations)} write(s): {e}")
+            return False
+
+    def flush(self) -> int:
+        """
+        Commit any buffered writes.
+
+        Returns:
+            Number of writes committed
+        """
+        with self._batch_lock:
+            batch = self._pending_batch
+            count = self._pending_count
+            timer = self._flush_timer
+            self._pending_batch = None
+            self._pending_count = 0
+            self._flush_timer = None
+
+        if timer is not None:
+            timer.cancel()
+
+        if batch is None or count == 0:
+            return 0
+
+        try:
+            batch.commit()
+            logger.debug(f"Flushed {count} buffered Firestore write(s)")
+            return count
+        except Exception as e:
+            logger.error(f"Failed to flush {count} buffered Firestore write(s): {e}")
+            raise
+
+    @property
+    def client(self) -> firestore.Client:
+        """Return the shared Firestore client used for all operations."""
+        if not self._db:
+            raise RuntimeError("Firestore client not initialized")
+        return self._db
+
     def get_collection_reference(self, collection_name: str) -> firestore.CollectionReference:
-        """Get a reference to a Firestore collection."""
+        """Get a reference to a Firestore collection on the shared client."""
         if not self._db:
             raise RuntimeError("Firestore client not initialized")
         return self._db.collection(collection_name)
     
     def close(self) -> None:
         """Close the Firestore service and clean up resources."""
+        try:
+            self.flush()
+        except Exception as e:
+            logger.debug(f"Error flushing buffered writes on close: {e}")
         if self._app:
             try:
                 firebase_admin.delete_app(self._app)
@@ -561,6 +947,8 @@ class FirestoreService:
                 logger.debug(f"Error deleting Firebase app: {e}")
             finally:
                 self._app = None
+                # Only drop the reference: the client is shared process-wide
+                # (see _CLIENT_CACHE / shutdown_all_clients)
                 self._db = None
     
     def __enter__(self) -> "FirestoreService":
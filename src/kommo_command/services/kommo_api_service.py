@@ -9,10 +9,20 @@ from typing import Any, Dict, List, Optional, Union
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError, RequestException, Timeout
 
 logger = logging.getLogger(__name__)
 
+# Entity-type lookup tables built once at import instead of per call
+_ENTITY_TYPE_CODES = {
+    'contact': '1',
+    'lead': '2',
+    'contacts': '1',  # Also accept plural
+    'leads': '2',     # Also accept plural
+}
+_VALID_ENTITY_TYPES = frozenset(('1', '2'))
+
 
 class KommoAPIError(Exception):
     """Base exception for Kommo API errors."""
@@ -67,8 +77,18 @@ class KommoAPIService:
         self.base_url = f"https://{subdomain}.kommo.com/api/v4/"
         self.base_url_v2 = f"https://{subdomain}.kommo.com/api/v2/"
         
-        # Initialize session
+        # Initialize session with a keep-alive connection pool so repeated
+        # calls reuse TCP/TLS connections instead of re-handshaking per
+        # request. Retries stay disabled at the adapter level: _make_request
+        # already retries 429s, timeouts and request errors itself, and
+        # stacking urllib3 retries underneath would multiply the attempts
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            max_retries=0,
+        )
+        self.session.mount('https://', adapter)
         self.session.headers.update({
             'Authorization': f'Bearer {access_token}',
             'Content-Type': 'application/json',
@@ -121,7 +141,11 @@ class KommoAPIService:
         if headers is not None:
             request_kwargs['headers'] = headers
         if data is not None:
-            request_kwargs['json'] = data
+            # Serialize the body here with compact separators instead of the
+            # json= path: requests would dump with padded separators, so this
+            # sends smaller payloads for the same one dumps call. The session
+            # already carries the application/json Content-Type header
+            request_kwargs['data'] = json.dumps(data, separators=(',', ':')).encode('utf-8')
         
         try:
             logger.debug(f"Making {method} request to {url}")
@@ -577,18 +601,11 @@ class KommoAPIService:
         Raises:
             ValueError: If entity_name is not supported
         """
-        entity_mapping = {
-            'contact': '1',
-            'lead': '2',
-            'contacts': '1',  # Also accept plural
-            'leads': '2',     # Also accept plural
-        }
-        
         entity_name_lower = entity_name.lower()
-        if entity_name_lower not in entity_mapping:
+        if entity_name_lower not in _ENTITY_TYPE_CODES:
             raise ValueError(f"Invalid entity_name '{entity_name}'. Must be 'contact', 'lead', 'contacts', or 'leads'")
         
-        return entity_mapping[entity_name_lower]
+        return _ENTITY_TYPE_CODES[entity_name_lower]
     
     def launch_salesbot(
         self,
@@ -619,7 +636,7 @@ class KommoAPIService:
             - API expects an array of salesbot launch requests
         """
         # Validate entity_type
-        if entity_type not in ('1', '2'):
+        if entity_type not in _VALID_ENTITY_TYPES:
             raise ValueError(f"Invalid entity_type '{entity_type}'. Must be '1' (contact) or '2' (lead)")
         
         # Prepare request data as an array (API expects array format)
@@ -685,7 +702,7 @@ class KommoAPIService:
                     raise ValueError(f"Request {i} missing required field: {field}")
             
             entity_type = str(request['entity_type'])
-            if entity_type not in ('1', '2'):
+            if entity_type not in _VALID_ENTITY_TYPES:
                 raise ValueError(f"Request {i} has invalid entity_type '{entity_type}'. Must be '1' or '2'")
             
             validated_requests.append({
@@ -5,7 +5,9 @@ from typing import Any, Dict, Optional
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError, RequestException, Timeout
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +47,17 @@ class LoveBaliAPIService:
         self.api_token = api_token.strip()
         self.timeout = timeout
 
+        # Keep-alive connection pool: repeated scans reuse TCP/TLS connections
+        # instead of re-handshaking per request
         self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=50,
+                max_retries=Retry(total=3, backoff_factor=0.2),
+            ),
+        )
         self.session.headers.update(
             {
                 "Authorization": f"Bearer {self.api_token}",
@@ -40,3 +40,6 @@ class AppLanguage(Enum):
 
 # List of command strings for easy checking against user messages
 COMMAND_LIST = [cmd.value for cmd in Command]
+
+# Frozenset of the same strings for O(1) membership tests on hot paths
+COMMAND_SET = frozenset(COMMAND_LIST)
@@ -1,13 +1,12 @@
 #!/usr/bin/env python3
-"""Advanced Firebase connection diagnostic tool."""
+"""Advanced Firebase connection diagnostic tool.
+
+Requires the package to be installed (pip install -e .).
+"""
 
 import sys
 import json
 import requests
-from pathlib import Path
-
-# Add the src directory to Python path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from kommo_command.config import Settings
 # from kommo_command.firebase_auth import TokenManager  # TODO: Implement or remove
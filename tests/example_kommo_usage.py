@@ -1,12 +1,7 @@
-"""Example usage of the Kommo API service."""
+"""Example usage of the Kommo API service.
 
-import os
-import sys
-from pathlib import Path
-
-# Add the src directory to the Python path
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+Requires the package to be installed (pip install -e .).
+"""
 
 from kommo_command.services import KommoAPIService
 from kommo_command.config import Settings
@@ -1,12 +1,11 @@
 #!/usr/bin/env python3
-"""Firebase Admin SDK connection test."""
+"""Firebase Admin SDK connection test.
+
+Requires the package to be installed (pip install -e .).
+"""
 
 import sys
 import os
-from pathlib import Path
-
-# Add the src directory to Python path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 try:
     import firebase_admin
@@ -0,0 +1,156 @@
+"""Unit tests for FirestoreService's session cache and buffered writes."""
+
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from kommo_command.models import SessionModel
+from kommo_command.services.firestore_service import FirestoreService
+
+
+class FakeSnapshot:
+    def __init__(self, data: Optional[Dict[str, Any]]) -> None:
+        self._data = data
+
+    @property
+    def exists(self) -> bool:
+        return self._data is not None
+
+    def to_dict(self) -> Optional[Dict[str, Any]]:
+        return self._data
+
+
+class FakeDocumentRef:
+    def __init__(self, db: "FakeDb", collection: str, document_id: str) -> None:
+        self._db = db
+        self._collection = collection
+        self.document_id = document_id
+
+    def get(self) -> FakeSnapshot:
+        self._db.reads += 1
+        return FakeSnapshot(self._db.documents.get((self._collection, self.document_id)))
+
+    def set(self, data: Dict[str, Any]) -> None:
+        self._db.documents[(self._collection, self.document_id)] = data
+
+    def delete(self, option: Any = None) -> None:
+        self._db.documents.pop((self._collection, self.document_id), None)
+
+
+class FakeCollection:
+    def __init__(self, db: "FakeDb", name: str) -> None:
+        self._db = db
+        self._name = name
+
+    def document(self, document_id: str) -> FakeDocumentRef:
+        return FakeDocumentRef(self._db, self._name, document_id)
+
+
+class FakeBatch:
+    def __init__(self, db: "FakeDb") -> None:
+        self._db = db
+        self.operations: List[tuple[FakeDocumentRef, Dict[str, Any]]] = []
+        self.committed = False
+
+    def set(self, doc_ref: FakeDocumentRef, data: Dict[str, Any]) -> None:
+        self.operations.append((doc_ref, data))
+
+    def commit(self) -> None:
+        self.committed = True
+        for doc_ref, data in self.operations:
+            doc_ref.set(data)
+        self._db.committed_batches.append(self)
+
+
+class FakeDb:
+    def __init__(self) -> None:
+        self.documents: Dict[tuple[str, str], Dict[str, Any]] = {}
+        self.committed_batches: List[FakeBatch] = []
+        self.reads = 0
+
+    def collection(self, name: str) -> FakeCollection:
+        return FakeCollection(self, name)
+
+    def batch(self) -> FakeBatch:
+        return FakeBatch(self)
+
+    def write_option(self, **_kwargs: Any) -> object:
+        return object()
+
+
+@pytest.fixture
+def service(monkeypatch) -> FirestoreService:
+    monkeypatch.setattr(FirestoreService, "_initialize_app", lambda self: None)
+    svc = FirestoreService(project_id="test-project", database_name="(default)")
+    svc._db = FakeDb()
+    return svc
+
+
+def _store_session(service: FirestoreService) -> SessionModel:
+    session = SessionModel(entity_id=101)
+    service._db.documents[("sessions", session.session_id)] = session.to_firestore_dict()
+    return session
+
+
+def test_get_session_served_from_cache_within_ttl(service):
+    session = _store_session(service)
+
+    first = service.get_session(session.session_id)
+    second = service.get_session(session.session_id)
+
+    assert first.session_id == second.session_id == session.session_id
+    assert service._db.reads == 1
+
+
+def test_get_session_cache_expires_after_ttl(service):
+    session = _store_session(service)
+    service.SESSION_CACHE_TTL = 0.0
+
+    service.get_session(session.session_id)
+    service.get_session(session.session_id)
+
+    assert service._db.reads == 2
+
+
+def test_delete_session_invalidates_cache(service):
+    session = _store_session(service)
+    service.get_session(session.session_id)
+
+    assert service.delete_session(session.session_id) is True
+    assert service.get_session(session.session_id) is None
+    assert service._db.reads == 2
+
+
+def test_cached_session_is_not_aliased(service):
+    session = _store_session(service)
+
+    first = service.get_session(session.session_id)
+    first.metadata["mutated"] = True
+    first.language = "xx"
+
+    second = service.get_session(session.session_id)
+    assert "mutated" not in second.metadata
+    assert second.language is None
+    assert second is not first
+
+
+def test_batch_write_commits_all_operations(service):
+    operations = [
+        ("leads", "lead-1", {"processed": True}),
+        ("sessions", "session-1", {"is_active": True}),
+    ]
+
+    assert service.batch_write(operations) is True
+    assert service._db.documents[("leads", "lead-1")] == {"processed": True}
+    assert service._db.documents[("sessions", "session-1")] == {"is_active": True}
+    assert len(service._db.committed_batches) == 1
+
+
+def test_close_flushes_buffered_writes(service):
+    service.buffered_set("leads", "lead-1", {"processed": False})
+    assert ("leads", "lead-1") not in service._db.documents
+
+    service.close()
+
+    assert service._db.documents[("leads", "lead-1")] == {"processed": False}
+    assert service._db.committed_batches[0].committed is True
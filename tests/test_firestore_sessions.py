@@ -1,16 +1,13 @@
-"""Test script for Firestore sessions functionality."""
+"""Test script for Firestore sessions functionality.
+
+Requires the package to be installed (pip install -e .).
+"""
 
 import logging
-import os
-import sys
 from datetime import datetime, timezone
-from pathlib import Path
 
 from dotenv import load_dotenv
 
-# Add src to path so we can import our modules
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
 from kommo_command.config import Settings
 from kommo_command.services import FirestoreService
 from kommo_command.models import SessionCreateRequest, SessionUpdateRequest
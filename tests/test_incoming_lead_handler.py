@@ -24,9 +24,6 @@ except ImportError:
                     key, value = line.split('=', 1)
                     os.environ[key.strip()] = value.strip()
 
-# Add the src directory to Python path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
 from kommo_command.config import Settings
 from kommo_command.services import FirebaseAdminListener, FirestoreService
 from kommo_command.handlers import HandlerManager, IncomingLeadHandler
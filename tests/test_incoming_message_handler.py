@@ -93,7 +93,19 @@ def _ensure_firebase_stubs() -> None:
     oauth2_stub.service_account = service_account_stub
     google_stub.oauth2 = oauth2_stub
 
-    if "pydantic" not in sys.modules:
+    api_core_stub = ModuleType("api_core")
+    api_core_exceptions_stub = ModuleType("exceptions")
+
+    class _DummyNotFound(Exception):
+        pass
+
+    api_core_exceptions_stub.NotFound = _DummyNotFound
+    api_core_stub.exceptions = api_core_exceptions_stub
+    google_stub.api_core = api_core_stub
+
+    try:
+        import pydantic  # noqa: F401  # prefer the real package when present
+    except ImportError:
         pydantic_stub = ModuleType("pydantic")
 
         class _DummyBaseModel:
@@ -125,6 +137,8 @@ def _ensure_firebase_stubs() -> None:
     sys.modules["google.cloud.firestore"] = firestore_stub
     sys.modules["google.oauth2"] = oauth2_stub
     sys.modules["google.oauth2.service_account"] = service_account_stub
+    sys.modules["google.api_core"] = api_core_stub
+    sys.modules["google.api_core.exceptions"] = api_core_exceptions_stub
 
 
 _ensure_firebase_stubs()
@@ -45,6 +45,10 @@ class FakeSession:
         self.headers: dict[str, str] = {}
         self.last_request: Optional[Dict[str, Any]] = None
         self.closed = False
+        self.adapters: dict[str, Any] = {}
+
+    def mount(self, prefix: str, adapter: Any) -> None:
+        self.adapters[prefix] = adapter
 
     def request(self, method: str, url: str, **kwargs) -> DummyResponse:
         self.last_request = {